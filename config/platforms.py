@@ -19,6 +19,8 @@ class PlatformInfo:
     title_selectors: list[str] = field(default_factory=list)
     email_selectors: list[str] = field(default_factory=list)
     phone_selectors: list[str] = field(default_factory=list)
+    # Cards keep emails/phones in mailto:/tel: links, read before the selectors above
+    uses_anchor_contacts: bool = True
     # Inventory count extraction
     inventory_count_selectors: list[str] = field(default_factory=list)
     inventory_count_patterns: list[str] = field(default_factory=list)
@@ -3,19 +3,31 @@
 import gzip
 import json
 import logging
+import math
 import random
 import re
 import xml.etree.ElementTree as ET
+from array import array
 from dataclasses import dataclass, field
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional
 from urllib.parse import urlparse
 
 import httpx
-from bs4 import BeautifulSoup
+import pandas as pd
+from selectolax.lexbor import LexborHTMLParser
 
+from crawlers.regex_engine import compile_pattern
 from crawlers.stealth import USER_AGENTS
 
+try:
+    import orjson
+
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
 logger = logging.getLogger(__name__)
 
 # Stealth headers for httpx requests (subset of browser headers)
@@ -36,8 +48,31 @@ STEALTH_HEADERS = {
 # URL pattern: /car-dealers/{city-state}/{dealer-id}/{dealer-slug}
 AUTOTRADER_URL_PATTERN = re.compile(r"/car-dealers/([^/]+)/([^/]+)/([^/?]+)")
 
+# Link text that marks the dealer's own website
+_WEBSITE_LINK_TEXT_PATTERN = re.compile(
+    r"(dealer\s*website|visit\s*(dealer\s*)?website|view\s*website|dealer\s*site)",
+    re.IGNORECASE,
+)
+
+# Absolute links, and absolute links whose data-cmp mentions "website" (any case); the
+# href and data-cmp filters run inside the lexbor selector engine rather than in Python
+_EXTERNAL_LINK_SELECTOR = 'a[href^="http"]'
+_WEBSITE_DATA_CMP_SELECTOR = 'a[href^="http"][data-cmp*="website" i]'
+
+# Inventory counts: "X vehicles found", "showing 1-25 of X", "X used cars for sale".
+# These scan the whole page text, so they go through RE2 when it is installed; RE2 has no
+# \u escapes, hence the en dash sits in a non-raw string.
+_INVENTORY_COUNT_PATTERNS = (
+    compile_pattern(r"(?i)([0-9][0-9,]*)[\s]+(?:vehicles?|cars?|listings?)[\s]+(?:found|available|for sale)"),
+    compile_pattern(r"(?i)showing[\s]+[0-9]+" "[-\u2013]" r"[0-9]+[\s]+of[\s]+([0-9][0-9,]*)"),
+    compile_pattern(r"(?i)([0-9][0-9,]*)[\s]+(?:new|used)?[\s]*(?:vehicles?|cars?)[\s]+for[\s]+sale"),
+)
+
+# Text inside these elements is not visible page text
+_NON_TEXT_TAGS = frozenset({"script", "style", "template"})
 
-@dataclass
+
+@dataclass(slots=True)
 class AutotraderDealer:
     """Structured data extracted from an Autotrader dealer page."""
 
@@ -69,19 +104,111 @@ class AutotraderDealer:
 
     @property
     def domain(self) -> str:
-        if not self.website_url:
-            return f"autotrader-{self.autotrader_dealer_id}"
-        try:
-            parsed = urlparse(self.website_url)
-            host = parsed.hostname or ""
-            return host.removeprefix("www.")
-        except Exception:
-            return f"autotrader-{self.autotrader_dealer_id}"
+        if self.website_url:
+            host = _website_host(self.website_url)
+            if host is not None:
+                return host
+        return f"autotrader-{self.autotrader_dealer_id}"
+
+
+@lru_cache(maxsize=8192)
+def _website_host(website_url: str) -> Optional[str]:
+    """Host of a dealer website without "www.", or None if the URL cannot be parsed.
+
+    Cached so repeated AutotraderDealer.domain lookups skip urlparse; the dealer
+    itself stays mutable because website_url is filled in after construction.
+    """
+    try:
+        host = urlparse(website_url).hostname or ""
+        return host.removeprefix("www.")
+    except Exception:
+        return None
+
+
+class AutotraderDealerBatch:
+    """Column-oriented store for many extracted dealers.
+
+    Text fields live in parallel lists and numeric fields in typed arrays, so a
+    large scrape holds no per-dealer objects. Missing ratings are stored as NaN
+    and missing counts as -1.
+    """
 
+    TEXT_FIELDS = (
+        "autotrader_url",
+        "autotrader_dealer_id",
+        "dealer_slug",
+        "city_state",
+        "name",
+        "phone",
+        "street_address",
+        "city",
+        "state",
+        "postal_code",
+        "website_url",
+    )
 
+    def __init__(self) -> None:
+        self.text: dict[str, list[str]] = {name: [] for name in self.TEXT_FIELDS}
+        self.rating_values = array("d")
+        self.review_counts = array("q")
+        self.inventory_counts = array("q")
+        self.hours: list[list[dict[str, str]]] = []
+
+    def __len__(self) -> int:
+        return len(self.rating_values)
+
+    def append(self, dealer: AutotraderDealer) -> None:
+        """Add one dealer's fields to the columns."""
+        for name, column in self.text.items():
+            column.append(getattr(dealer, name))
+        self.rating_values.append(math.nan if dealer.rating_value is None else dealer.rating_value)
+        self.review_counts.append(-1 if dealer.review_count is None else dealer.review_count)
+        self.inventory_counts.append(-1 if dealer.inventory_count is None else dealer.inventory_count)
+        self.hours.append(dealer.hours)
+
+    def append_from_html(self, html: str, url: str) -> bool:
+        """Extract a dealer page straight into the columns.
+
+        Returns:
+            True if the page was added, False if extraction failed.
+        """
+        dealer = extract_dealer_data(html, url)
+        if dealer is None:
+            return False
+        self.append(dealer)
+        return True
+
+    def __getitem__(self, index: int) -> AutotraderDealer:
+        """Rebuild a single AutotraderDealer, e.g. for saving one record."""
+        rating = self.rating_values[index]
+        review_count = self.review_counts[index]
+        inventory_count = self.inventory_counts[index]
+        return AutotraderDealer(
+            **{name: column[index] for name, column in self.text.items()},
+            rating_value=None if math.isnan(rating) else rating,
+            review_count=None if review_count < 0 else review_count,
+            hours=self.hours[index],
+            inventory_count=None if inventory_count < 0 else inventory_count,
+        )
+
+    def to_pandas(self) -> pd.DataFrame:
+        """Return one row per dealer, with nullable integer count columns."""
+        df = pd.DataFrame(self.text)
+        df["rating_value"] = pd.Series(self.rating_values, dtype="float64")
+        for name, values in (("review_count", self.review_counts), ("inventory_count", self.inventory_counts)):
+            counts = pd.Series(values, dtype="Int64")
+            df[name] = counts.mask(counts < 0)
+        df["hours"] = self.hours
+        return df
+
+
+@lru_cache(maxsize=8192)
 def parse_autotrader_url(url: str) -> tuple[str, str, str]:
     """Parse an Autotrader dealer URL into (dealer_id, city_state, slug).
 
+    Results are cached, since the fetcher, extractor and CRM sync each parse
+    the same URL.
+
     Args:
         url: Full Autotrader dealer URL.
 
@@ -208,7 +335,7 @@ def extract_dealer_data(html: str, url: str) -> Optional[AutotraderDealer]:
         logger.warning(f"Cannot parse dealer URL: {url}")
         return None
 
-    soup = BeautifulSoup(html, "lxml")
+    tree = _parse_html(html)
 
     dealer = AutotraderDealer(
         autotrader_url=url,
@@ -218,7 +345,7 @@ def extract_dealer_data(html: str, url: str) -> Optional[AutotraderDealer]:
     )
 
     # Extract JSON-LD data
-    jsonld = _extract_jsonld(soup)
+    jsonld = _extract_jsonld(tree)
     if jsonld:
         dealer.name = jsonld.get("name", "")
         dealer.phone = jsonld.get("telephone", "")
@@ -258,46 +385,84 @@ def extract_dealer_data(html: str, url: str) -> Optional[AutotraderDealer]:
         dealer.name = slug.replace("-", " ").title()
 
     # Extract website URL
-    dealer.website_url = _extract_dealer_website(soup)
+    dealer.website_url = _extract_dealer_website(tree)
 
     # Extract inventory count
-    dealer.inventory_count = _extract_inventory_count(soup)
+    dealer.inventory_count = _extract_inventory_count(tree)
 
     return dealer
 
 
-def _extract_jsonld(soup: BeautifulSoup) -> Optional[dict]:
+def _parse_html(html: str) -> LexborHTMLParser:
+    """Parse a dealer page with the C-backed lexbor engine.
+
+    Args:
+        html: Raw HTML content.
+
+    Returns:
+        Parsed document tree shared by the extractors below.
+    """
+    return LexborHTMLParser(html)
+
+
+def _page_text(tree: LexborHTMLParser) -> str:
+    """Join the page's visible text nodes with single spaces, skipping script and style content."""
+    texts = []
+    for node in tree.root.traverse(include_text=True):
+        if node.tag == "-text" and node.parent.tag not in _NON_TEXT_TAGS:
+            text = node.text_content.strip()
+            if text:
+                texts.append(text)
+    return " ".join(texts)
+
+
+def _extract_jsonld(tree: LexborHTMLParser) -> Optional[dict]:
     """Extract AutoDealer JSON-LD from the page.
 
     Args:
-        soup: Parsed BeautifulSoup object.
+        tree: Parsed page from _parse_html.
 
     Returns:
-        JSON-LD dict for the AutoDealer, or None.
+        JSON-LD dict for the AutoDealer, or None. The dict is shared with the
+        decode cache and must not be mutated.
     """
-    for script in soup.find_all("script", type="application/ld+json"):
-        try:
-            data = json.loads(script.string or "")
-        except (json.JSONDecodeError, TypeError):
-            continue
-
-        # Handle single object or list
-        items = data if isinstance(data, list) else [data]
-        for item in items:
-            if isinstance(item, dict):
-                item_type = item.get("@type", "")
-                if item_type in ("AutoDealer", "AutoBodyShop", "LocalBusiness"):
-                    return item
-                # Check @graph
-                for graph_item in item.get("@graph", []):
-                    if isinstance(graph_item, dict):
-                        gt = graph_item.get("@type", "")
-                        if gt in ("AutoDealer", "AutoBodyShop", "LocalBusiness"):
-                            return graph_item
+    for script in tree.css('script[type="application/ld+json"]'):
+        item = _decode_jsonld(script.text())
+        if item is not None:
+            return item
     return None
 
 
-def _extract_dealer_website(soup: BeautifulSoup) -> str:
+@lru_cache(maxsize=1024)
+def _decode_jsonld(payload: str) -> Optional[dict]:
+    """Decode one JSON-LD payload and return its AutoDealer item, or None.
+
+    Cached by payload text: dealer pages are rendered from shared templates and
+    re-scraped across runs, so identical payloads are common.
+    """
+    try:
+        # orjson.JSONDecodeError subclasses json.JSONDecodeError
+        data = _json_loads(payload)
+    except (json.JSONDecodeError, TypeError):
+        return None
+
+    # Handle single object or list
+    items = data if isinstance(data, list) else [data]
+    for item in items:
+        if isinstance(item, dict):
+            item_type = item.get("@type", "")
+            if item_type in ("AutoDealer", "AutoBodyShop", "LocalBusiness"):
+                return item
+            # Check @graph
+            for graph_item in item.get("@graph", []):
+                if isinstance(graph_item, dict):
+                    gt = graph_item.get("@type", "")
+                    if gt in ("AutoDealer", "AutoBodyShop", "LocalBusiness"):
+                        return graph_item
+    return None
+
+
+def _extract_dealer_website(tree: LexborHTMLParser) -> str:
     """Extract the dealer's own website URL from the page.
 
     Strategy:
@@ -306,31 +471,22 @@ def _extract_dealer_website(soup: BeautifulSoup) -> str:
     3. External links in dealer info sections.
 
     Args:
-        soup: Parsed BeautifulSoup object.
+        tree: Parsed page from _parse_html.
 
     Returns:
         Website URL string, or empty string if not found.
     """
-    website_text_patterns = re.compile(
-        r"(dealer\s*website|visit\s*(dealer\s*)?website|view\s*website|dealer\s*site)",
-        re.IGNORECASE,
-    )
-
     # Strategy 1: text-based
-    for a in soup.find_all("a", href=True):
-        text = a.get_text(strip=True)
-        if website_text_patterns.search(text):
-            href = a["href"]
-            if href.startswith("http") and "autotrader.com" not in href:
-                return href
+    for a in tree.css(_EXTERNAL_LINK_SELECTOR):
+        href = a.attributes["href"]
+        if "autotrader.com" not in href and _WEBSITE_LINK_TEXT_PATTERN.search(a.text(separator="", strip=True)):
+            return href
 
     # Strategy 2: data-cmp attribute
-    for a in soup.find_all("a", attrs={"data-cmp": True}):
-        cmp = (a.get("data-cmp") or "").lower()
-        if "website" in cmp:
-            href = a.get("href", "")
-            if href.startswith("http") and "autotrader.com" not in href:
-                return href
+    for a in tree.css(_WEBSITE_DATA_CMP_SELECTOR):
+        href = a.attributes["href"]
+        if "autotrader.com" not in href:
+            return href
 
     # Strategy 3: external links in dealer info sections
     info_selectors = [
@@ -340,12 +496,14 @@ def _extract_dealer_website(soup: BeautifulSoup) -> str:
         "[data-cmp*='dealer']",
     ]
     for selector in info_selectors:
-        for section in soup.select(selector):
-            for a in section.find_all("a", href=True):
-                href = a["href"]
+        for section in tree.css(selector):
+            for a in section.css(_EXTERNAL_LINK_SELECTOR):
+                # Node.css matches the section itself; only links inside it count
+                if a == section:
+                    continue
+                href = a.attributes["href"]
                 if (
-                    href.startswith("http")
-                    and "autotrader.com" not in href
+                    "autotrader.com" not in href
                     and "autocheck.com" not in href
                     and "facebook.com" not in href
                     and "google.com" not in href
@@ -361,27 +519,20 @@ def _extract_dealer_website(soup: BeautifulSoup) -> str:
     return ""
 
 
-def _extract_inventory_count(soup: BeautifulSoup) -> Optional[int]:
+def _extract_inventory_count(tree: LexborHTMLParser) -> Optional[int]:
     """Extract total inventory count from the page.
 
     Looks for text patterns like "123 vehicles" or "showing 1-25 of 456".
 
     Args:
-        soup: Parsed BeautifulSoup object.
+        tree: Parsed page from _parse_html.
 
     Returns:
         Integer vehicle count, or None if not found.
     """
-    text = soup.get_text(" ", strip=True)
-
-    # Pattern: "X vehicles" or "X cars" or "X listings"
-    patterns = [
-        re.compile(r"(\d[\d,]*)\s+(?:vehicles?|cars?|listings?)\s+(?:found|available|for sale)", re.IGNORECASE),
-        re.compile(r"showing\s+\d+[-\u2013]\d+\s+of\s+(\d[\d,]*)", re.IGNORECASE),
-        re.compile(r"(\d[\d,]*)\s+(?:new|used)?\s*(?:vehicles?|cars?)\s+for\s+sale", re.IGNORECASE),
-    ]
+    text = _page_text(tree)
 
-    for pattern in patterns:
+    for pattern in _INVENTORY_COUNT_PATTERNS:
         match = pattern.search(text)
         if match:
             try:
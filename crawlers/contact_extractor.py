@@ -1,41 +1,36 @@
 """Generic and provider-specific contact extraction from HTML."""
 
+import concurrent.futures
 import logging
 import re
-from typing import Any, Optional
+import sys
+from functools import lru_cache
+from typing import Any, Callable, Iterable, Iterator, Optional, Union
 
-from bs4 import BeautifulSoup, Tag
+from selectolax.lexbor import LexborHTMLParser, LexborNode
 
 from config.platforms import PlatformInfo
+from crawlers.regex_engine import compile_pattern
 
 logger = logging.getLogger(__name__)
 
 # Email patterns
-EMAIL_REGEX = re.compile(
-    r"[a-zA-Z0-9._%+\-]+@[a-zA-Z0-9.\-]+\.[a-zA-Z]{2,}",
-    re.IGNORECASE,
-)
+EMAIL_REGEX = compile_pattern(r"(?i)[a-zA-Z0-9._%+\-]+@[a-zA-Z0-9.\-]+\.[a-zA-Z]{2,}")
 
 # Obfuscated email patterns (e.g., "name [at] domain [dot] com")
-OBFUSCATED_EMAIL_REGEX = re.compile(
-    r"([a-zA-Z0-9._%+\-]+)\s*[\[\(]?\s*(?:at|AT)\s*[\]\)]?\s*"
-    r"([a-zA-Z0-9.\-]+)\s*[\[\(]?\s*(?:dot|DOT)\s*[\]\)]?\s*"
-    r"([a-zA-Z]{2,})",
-    re.IGNORECASE,
+OBFUSCATED_EMAIL_REGEX = compile_pattern(
+    r"(?i)([a-zA-Z0-9._%+\-]+)[\s]*[\[\(]?[\s]*(?:at|AT)[\s]*[\]\)]?[\s]*"
+    r"([a-zA-Z0-9.\-]+)[\s]*[\[\(]?[\s]*(?:dot|DOT)[\s]*[\]\)]?[\s]*"
+    r"([a-zA-Z]{2,})"
 )
 
-# US phone patterns
-PHONE_REGEX = re.compile(
-    r"""
-    (?:                        # Optional prefix
-        \+?1[\s.-]?            # Country code
-    )?
-    (?:                        # Area code
-        \(?\d{3}\)?[\s.-]?     # (xxx) or xxx
-    )
-    \d{3}[\s.-]?\d{4}         # xxx-xxxx
-    """,
-    re.VERBOSE,
+# US phone patterns: optional +1 country code, (xxx) or xxx area code, then xxx-xxxx
+PHONE_REGEX = compile_pattern(r"(?:\+?1[\s.-]?)?(?:\(?[0-9]{3}\)?[\s.-]?)[0-9]{3}[\s.-]?[0-9]{4}")
+
+# Deletes everything PHONE_REGEX matches besides digits (punctuation and \s whitespace),
+# reducing a matched phone to its digits for dedup without a regex pass
+_PHONE_FORMATTING_DELETE = str.maketrans(
+    "", "", "+().-" + "".join(char for char in map(chr, range(0x3001)) if char.isspace())
 )
 
 # Excluded email patterns
@@ -73,43 +68,269 @@ EXCLUDED_DOMAINS = {
     "cloudflare.com",
 }
 
+# Elements whose text is not visible content; dropped right after parsing
+_NON_TEXT_TAGS = ["script", "style", "template"]
+_NON_TEXT_SELECTOR = ", ".join(_NON_TEXT_TAGS)
+
+# Elements treated as a name heading next to a bare email
+_NAME_HEADING_TAGS = frozenset({"h2", "h3", "h4", "h5", "strong"})
+
+# Generic card fields, in priority order. All are simple selectors, so one walk
+# over a card can test them per element (see _scan_card).
+_GENERIC_NAME_SELECTORS = ("h2", "h3", "h4", "h5", "strong", ".name", "[class*='name']", "[itemprop='name']")
+_GENERIC_TITLE_SELECTORS = (
+    "[class*='title']",
+    "[class*='position']",
+    "[class*='role']",
+    "[class*='job']",
+    "[itemprop='jobTitle']",
+    ".title",
+    "p",
+    "span",
+)
+_GENERIC_HEADING_SELECTOR = "h2, h3, h4, h5"
+
+_SIMPLE_ATTRIBUTE_SELECTOR = re.compile(r"\[([\w-]+)(\*?)='([^']*)'\]")
+_ATTRIBUTE_SELECTOR = re.compile(r"\[[^\]]*\]")
+_SELECTOR_CLASS = re.compile(r"\.([\w-]+)")
+_SIMPLE_CLASS_SELECTOR = re.compile(r"\.[\w-]+")
+_TAG_LIST_SELECTOR = re.compile(r"[a-z][a-z0-9]*(?:\s*,\s*[a-z][a-z0-9]*)*")
+
 
 def extract_contacts_from_html(
-    html: str, base_domain: str = "", platform_info: Optional[PlatformInfo] = None
+    html: Union[str, LexborHTMLParser], base_domain: str = "", platform_info: Optional[PlatformInfo] = None
 ) -> list[dict[str, Any]]:
     """Extract structured contacts from an HTML page.
 
     When platform_info is provided, tries provider-specific selectors first
     for much more reliable extraction.
+
+    html may also be an already parsed LexborHTMLParser tree, so callers that
+    inspect the same page several times parse it once. The tree has its
+    script/style/template elements removed in place; like raw HTML, the flat
+    fallback still scans the markup as it was before they were removed.
+
+    Job titles are interned: a roster repeats a handful of titles, so contacts
+    share one string per title, which extract_contacts_from_many also pickles
+    only once per page.
     """
-    soup = BeautifulSoup(html, "lxml")
+    if isinstance(html, str):
+        tree = _parse_html(html)
+    else:
+        tree = html
+        # The flat fallback scans the markup as passed in, scripts included. A tree
+        # without such elements serializes the same after stripping, so only serialize
+        # up front when stripping changes it.
+        html = (tree.html or "") if tree.css_first(_NON_TEXT_SELECTOR) is not None else None
+        tree.strip_tags(_NON_TEXT_TAGS)
 
     # Try provider-specific extraction first
     if platform_info and platform_info.card_selectors:
-        contacts = _extract_provider_contacts(soup, base_domain, platform_info)
+        contacts = _extract_provider_contacts(tree, base_domain, platform_info)
         if contacts:
             return _deduplicate_contacts(contacts)
 
     # Fall back to generic structured extraction
-    contacts = _extract_structured_contacts(soup, base_domain)
+    contacts = _extract_structured_contacts(tree, base_domain)
 
     if not contacts:
-        contacts = _extract_flat_contacts(soup, html, base_domain)
+        # Only the flat fallback scans the markup, so a script-free tree is serialized here
+        if html is None:
+            html = tree.html or ""
+        contacts = _extract_flat_contacts(tree, html, base_domain)
 
     return _deduplicate_contacts(contacts)
 
 
+def extract_contacts_from_many(
+    pages: Iterable[tuple[str, str]], workers: Optional[int] = None, chunksize: int = 4
+) -> Iterator[list[dict[str, Any]]]:
+    """Extract contacts from many (html, base_domain) pages across worker processes.
+
+    Parsing and regex scanning hold the GIL, so pages are spread over a process
+    pool instead of threads. Results are yielded in input order, each identical
+    to extract_contacts_from_html on that page.
+    """
+    if workers == 1:
+        for html, base_domain in pages:
+            yield extract_contacts_from_html(html, base_domain)
+        return
+
+    with concurrent.futures.ProcessPoolExecutor(max_workers=workers) as executor:
+        yield from executor.map(_extract_page_contacts, pages, chunksize=chunksize)
+
+
+def _extract_page_contacts(page: tuple[str, str]) -> list[dict[str, Any]]:
+    html, base_domain = page
+    return extract_contacts_from_html(html, base_domain)
+
+
+def _parse_html(html: str) -> LexborHTMLParser:
+    """Parse a page with the C-backed lexbor engine, dropping non-visible text elements."""
+    tree = LexborHTMLParser(html)
+    tree.strip_tags(_NON_TEXT_TAGS)
+    return tree
+
+
+def _css(element: Union[LexborHTMLParser, LexborNode], selector: str) -> list[LexborNode]:
+    """All matches of selector, with its classes compared case-sensitively.
+
+    lexbor matches classes case-insensitively in quirks-mode (no DOCTYPE) documents,
+    unlike BeautifulSoup, so matches lacking an exact class token are dropped.
+    """
+    matches = element.css(selector)
+    compound_classes = _selector_classes(selector)
+    if any(compound_classes):
+        matches = [match for match in matches if _has_exact_classes(match, compound_classes)]
+    return matches
+
+
+@lru_cache(maxsize=256)
+def _selector_classes(selector: str) -> tuple[frozenset[str], ...]:
+    """Class names required by each compound of a selector, outermost first."""
+    compounds = re.split(r"[\s>+~]+", _ATTRIBUTE_SELECTOR.sub("", selector).strip())
+    return tuple(frozenset(_SELECTOR_CLASS.findall(compound)) for compound in compounds)
+
+
+def _node_classes(node: LexborNode) -> set[str]:
+    return set((node.attributes.get("class") or "").split())
+
+
+def _has_exact_classes(node: LexborNode, compound_classes: tuple[frozenset[str], ...]) -> bool:
+    """Whether node and, in order, some of its ancestors carry each compound's classes exactly."""
+    *ancestor_classes, subject_classes = compound_classes
+    if not subject_classes <= _node_classes(node):
+        return False
+    ancestor = node.parent
+    for required in reversed(ancestor_classes):
+        if not required:
+            continue
+        while ancestor is not None and not required <= _node_classes(ancestor):
+            ancestor = ancestor.parent
+        if ancestor is None:
+            return False
+        ancestor = ancestor.parent
+    return True
+
+
+def _select_one(element: LexborNode, selector: str) -> Optional[LexborNode]:
+    """First descendant of element matching selector.
+
+    lexbor's css/css_first also match the element itself, which BeautifulSoup's
+    select_one never did, so a self-match is skipped.
+    """
+    if any(_selector_classes(selector)):
+        return next((match for match in _css(element, selector) if match != element), None)
+    match = element.css_first(selector)
+    if match is not None and match == element:
+        matches = element.css(selector)
+        return matches[1] if len(matches) > 1 else None
+    return match
+
+
+def _simple_selector_predicate(selector: str) -> Callable[[LexborNode, str, dict], bool]:
+    """Predicate over (node, tag, attributes) for a tag list, .class or [attr='v']/[attr*='v'] selector.
+
+    Classes are compared as exact tokens, as BeautifulSoup did, even in quirks-mode
+    documents where lexbor would ignore their case.
+    """
+    if selector.startswith("."):
+        class_name = selector[1:]
+        return lambda node, tag, attrs: class_name in (attrs.get("class") or "").split()
+
+    match = _SIMPLE_ATTRIBUTE_SELECTOR.fullmatch(selector)
+    if match:
+        attr, substring, value = match.groups()
+        if substring:
+            return lambda node, tag, attrs: value in (attrs.get(attr) or "")
+        return lambda node, tag, attrs: attrs.get(attr) == value
+
+    tags = frozenset(part.strip() for part in selector.split(","))
+    return lambda node, tag, attrs: tag in tags
+
+
+_GENERIC_CARD_PREDICATES = tuple(
+    _simple_selector_predicate(selector)
+    for selector in (*_GENERIC_NAME_SELECTORS, *_GENERIC_TITLE_SELECTORS, _GENERIC_HEADING_SELECTOR, "img")
+)
+
+
+@lru_cache(maxsize=64)
+def _card_predicates(selectors: tuple[str, ...]) -> tuple[Optional[Callable[[LexborNode, str, dict], bool]], ...]:
+    """Predicates for the simple selectors among a platform's card selectors; None for the rest."""
+    return tuple(
+        _simple_selector_predicate(selector)
+        if _SIMPLE_CLASS_SELECTOR.fullmatch(selector)
+        or _SIMPLE_ATTRIBUTE_SELECTOR.fullmatch(selector)
+        or _TAG_LIST_SELECTOR.fullmatch(selector)
+        else None
+        for selector in selectors
+    )
+
+
+def _scan_card(
+    element: LexborNode, predicates: tuple[Optional[Callable[[LexborNode, str, dict], bool]], ...]
+) -> tuple[list[Optional[LexborNode]], list[str]]:
+    """Walk a card's subtree once, collecting every field candidate.
+
+    Returns:
+        The first descendant matching each predicate (None when nothing matches
+        or the predicate itself is None), and the href values of the card's
+        links in document order.
+    """
+    found: list[Optional[LexborNode]] = [None] * len(predicates)
+    hrefs: list[str] = []
+    # Only predicates still without a match are tested; once all have one, the
+    # rest of the walk just collects links
+    pending = [(i, predicate) for i, predicate in enumerate(predicates) if predicate is not None]
+    nodes = element.traverse()
+    next(nodes)  # the card itself
+    for node in nodes:
+        tag = node.tag
+        if not pending and tag != "a":
+            continue
+        attrs = node.attributes
+        if tag == "a" and "href" in attrs:
+            hrefs.append(attrs["href"] or "")
+        matched = False
+        for i, predicate in pending:
+            if predicate(node, tag, attrs):
+                found[i] = node
+                matched = True
+        if matched:
+            pending = [(i, predicate) for i, predicate in pending if found[i] is None]
+    return found, hrefs
+
+
+def _first_mailto_email(hrefs: list[str], base_domain: str) -> str:
+    """First valid contact email among a card's mailto: links."""
+    for href in hrefs:
+        if href.startswith("mailto:"):
+            email = href.replace("mailto:", "").split("?")[0].strip()
+            if _is_valid_contact_email(email, base_domain):
+                return email
+    return ""
+
+
+def _first_tel_number(hrefs: list[str]) -> Optional[str]:
+    """Number from a card's first tel: link, or None without one."""
+    for href in hrefs:
+        if href.startswith("tel:"):
+            return href.replace("tel:", "").strip()
+    return None
+
+
 def _extract_provider_contacts(
-    soup: BeautifulSoup, base_domain: str, platform_info: PlatformInfo
+    tree: LexborHTMLParser, base_domain: str, platform_info: PlatformInfo
 ) -> list[dict[str, Any]]:
     """Extract contacts using provider-specific CSS selectors."""
     contacts: list[dict[str, Any]] = []
 
     # Find cards using provider-specific selectors
-    cards: list[Tag] = []
+    cards: list[LexborNode] = []
     for selector in platform_info.card_selectors:
         try:
-            found = soup.select(selector)
+            found = _css(tree, selector)
             if found:
                 cards = found
                 logger.debug(f"Provider selector '{selector}' matched {len(found)} cards")
@@ -130,17 +351,38 @@ def _extract_provider_contacts(
 
 
 def _parse_provider_card(
-    element: Tag, base_domain: str, platform_info: PlatformInfo
+    element: LexborNode, base_domain: str, platform_info: PlatformInfo
 ) -> dict[str, Any]:
-    """Parse a contact card using provider-specific selectors."""
+    """Parse a contact card using provider-specific selectors.
+
+    The platform's simple selectors are all tested in one walk over the card
+    (see _scan_card); selectors with combinators or attribute prefixes are
+    handed to lexbor when their turn comes.
+    """
     contact: dict[str, Any] = {"source": "crawl"}
 
+    name_selectors = platform_info.name_selectors
+    title_selectors = platform_info.title_selectors
+    email_selectors = platform_info.email_selectors
+    phone_selectors = platform_info.phone_selectors
+    selectors = (*name_selectors, *title_selectors, *email_selectors, *phone_selectors, "img")
+    predicates = _card_predicates(selectors)
+    found, hrefs = _scan_card(element, predicates)
+    title_start = len(name_selectors)
+    email_start = title_start + len(title_selectors)
+    phone_start = email_start + len(email_selectors)
+
+    def first_match(index: int) -> Optional[LexborNode]:
+        if predicates[index] is None:
+            return _select_one(element, selectors[index])
+        return found[index]
+
     # Extract name using provider-specific selectors
-    for selector in platform_info.name_selectors:
+    for index in range(title_start):
         try:
-            name_el = element.select_one(selector)
+            name_el = first_match(index)
             if name_el:
-                name = name_el.get_text(strip=True)
+                name = name_el.text(separator="", strip=True)
                 if name and 2 < len(name) < 80 and not _is_generic_text(name) and _looks_like_person_name(name):
                     contact["name"] = name
                     break
@@ -148,13 +390,13 @@ def _parse_provider_card(
             continue
 
     # Extract title using provider-specific selectors
-    for selector in platform_info.title_selectors:
+    for index in range(title_start, email_start):
         try:
-            title_el = element.select_one(selector)
+            title_el = first_match(index)
             if title_el:
-                title = title_el.get_text(strip=True)
+                title = title_el.text(separator="", strip=True)
                 if title and 3 < len(title) < 100 and _looks_like_title(title):
-                    contact["title"] = title
+                    contact["title"] = sys.intern(title)
                     break
         except Exception:
             continue
@@ -162,81 +404,94 @@ def _parse_provider_card(
     # Fallback: extract title from bare text nodes in the card
     # (e.g. Overfuel puts job title as a text node, not in a tag)
     if "title" not in contact:
-        from bs4 import NavigableString
-
-        for child in element.children:
-            if isinstance(child, NavigableString):
-                text = child.strip()
+        for child in element.iter(include_text=True):
+            if child.tag == "-text":
+                text = child.text_content.strip()
                 if text and 3 < len(text) < 100 and _looks_like_title(text):
-                    contact["title"] = text
+                    contact["title"] = sys.intern(text)
                     break
 
+    # Anchor-based platforms keep emails and phones in mailto:/tel: links, so read
+    # those directly and only use the text selectors when no link qualifies
+    anchor_contacts = platform_info.uses_anchor_contacts
+    if anchor_contacts:
+        email = _first_mailto_email(hrefs, base_domain)
+        if email:
+            contact["email"] = email
+
     # Extract email using provider-specific selectors, then fallback
-    for selector in platform_info.email_selectors:
-        try:
-            email_el = element.select_one(selector)
-            if email_el:
-                if selector.startswith("a[href"):
-                    href = email_el.get("href", "")
-                    if href.startswith("mailto:"):
-                        email = href.replace("mailto:", "").split("?")[0].strip()
-                        if _is_valid_contact_email(email, base_domain):
-                            contact["email"] = email
+    if "email" not in contact:
+        for index in range(email_start, phone_start):
+            selector = selectors[index]
+            if anchor_contacts and selector.startswith("a[href"):
+                continue
+            try:
+                email_el = first_match(index)
+                if email_el:
+                    if selector.startswith("a[href"):
+                        href = email_el.attributes.get("href") or ""
+                        if href.startswith("mailto:"):
+                            email = href.replace("mailto:", "").split("?")[0].strip()
+                            if _is_valid_contact_email(email, base_domain):
+                                contact["email"] = email
+                                break
+                    else:
+                        text = email_el.text(separator="", strip=True)
+                        emails = extract_emails(text, base_domain)
+                        if emails:
+                            contact["email"] = emails[0]
                             break
-                else:
-                    text = email_el.get_text(strip=True)
-                    emails = extract_emails(text, base_domain)
-                    if emails:
-                        contact["email"] = emails[0]
-                        break
-        except Exception:
-            continue
+            except Exception:
+                continue
 
-    # Fallback: scan card text for emails
-    if "email" not in contact:
-        for a_tag in element.find_all("a", href=True):
-            href = a_tag["href"]
-            if href.startswith("mailto:"):
-                email = href.replace("mailto:", "").split("?")[0].strip()
-                if _is_valid_contact_email(email, base_domain):
-                    contact["email"] = email
-                    break
+    # Fallback: scan card for mailto: links
+    if "email" not in contact and not anchor_contacts:
+        email = _first_mailto_email(hrefs, base_domain)
+        if email:
+            contact["email"] = email
+
+    if anchor_contacts:
+        phone = _first_tel_number(hrefs)
+        if phone is not None:
+            contact["phone"] = phone
 
     # Extract phone using provider-specific selectors, then fallback
-    for selector in platform_info.phone_selectors:
-        try:
-            phone_el = element.select_one(selector)
-            if phone_el:
-                if selector.startswith("a[href"):
-                    href = phone_el.get("href", "")
-                    if href.startswith("tel:"):
-                        contact["phone"] = href.replace("tel:", "").strip()
-                        break
-                else:
-                    phones = extract_phones(phone_el.get_text())
-                    if phones:
-                        contact["phone"] = phones[0]
-                        break
-        except Exception:
-            continue
+    if "phone" not in contact:
+        for index in range(phone_start, len(selectors) - 1):
+            selector = selectors[index]
+            if anchor_contacts and selector.startswith("a[href"):
+                continue
+            try:
+                phone_el = first_match(index)
+                if phone_el:
+                    if selector.startswith("a[href"):
+                        href = phone_el.attributes.get("href") or ""
+                        if href.startswith("tel:"):
+                            contact["phone"] = href.replace("tel:", "").strip()
+                            break
+                    else:
+                        phones = extract_phones(phone_el.text())
+                        if phones:
+                            contact["phone"] = phones[0]
+                            break
+            except Exception:
+                continue
 
     # Fallback: scan card for tel: links
-    if "phone" not in contact:
-        for a_tag in element.find_all("a", href=True):
-            href = a_tag["href"]
-            if href.startswith("tel:"):
-                contact["phone"] = href.replace("tel:", "").strip()
-                break
+    if "phone" not in contact and not anchor_contacts:
+        phone = _first_tel_number(hrefs)
+        if phone is not None:
+            contact["phone"] = phone
 
     # Extract photo URL
-    img = element.select_one("img")
-    if img and img.get("src"):
-        contact["photo_url"] = img["src"]
+    img = found[-1]
+    if img and img.attributes.get("src"):
+        contact["photo_url"] = img.attributes["src"]
 
     return contact
 
 
-def _extract_structured_contacts(soup: BeautifulSoup, base_domain: str) -> list[dict[str, Any]]:
+def _extract_structured_contacts(tree: LexborHTMLParser, base_domain: str) -> list[dict[str, Any]]:
     """Extract contacts from structured card-like HTML elements."""
     contacts: list[dict[str, Any]] = []
 
@@ -256,7 +511,7 @@ def _extract_structured_contacts(soup: BeautifulSoup, base_domain: str) -> list[
 
     cards = []
     for selector in card_selectors:
-        found = soup.select(selector)
+        found = _css(tree, selector)
         if found:
             cards = found
             break
@@ -272,44 +527,35 @@ def _extract_structured_contacts(soup: BeautifulSoup, base_domain: str) -> list[
     return contacts
 
 
-def _parse_contact_card(element, base_domain: str) -> dict[str, Any]:
+def _parse_contact_card(element: LexborNode, base_domain: str) -> dict[str, Any]:
     """Parse a single contact card element."""
     contact: dict[str, Any] = {"source": "crawl"}
+    found, hrefs = _scan_card(element, _GENERIC_CARD_PREDICATES)
+    name_count = len(_GENERIC_NAME_SELECTORS)
+    title_count = len(_GENERIC_TITLE_SELECTORS)
+    heading_el, img = found[name_count + title_count :]
 
     # Extract name from headings
-    for tag in ["h2", "h3", "h4", "h5", "strong", ".name", "[class*='name']", "[itemprop='name']"]:
-        name_el = element.select_one(tag)
+    for name_el in found[:name_count]:
         if name_el:
-            name = name_el.get_text(strip=True)
+            name = name_el.text(separator="", strip=True)
             if name and len(name) > 2 and len(name) < 80 and not _is_generic_text(name) and _looks_like_person_name(name):
                 contact["name"] = name
                 break
 
     # Extract title/role
-    title_selectors = [
-        "[class*='title']",
-        "[class*='position']",
-        "[class*='role']",
-        "[class*='job']",
-        "[itemprop='jobTitle']",
-        ".title",
-        "p",
-        "span",
-    ]
-    for sel in title_selectors:
-        title_el = element.select_one(sel)
-        if title_el and title_el != element.select_one("h2, h3, h4, h5"):
-            title = title_el.get_text(strip=True)
+    for title_el in found[name_count : name_count + title_count]:
+        if title_el and title_el != heading_el:
+            title = title_el.text(separator="", strip=True)
             if title and len(title) > 3 and len(title) < 100 and _looks_like_title(title):
-                contact["title"] = title
+                contact["title"] = sys.intern(title)
                 break
 
     # Extract email
-    card_text = element.get_text()
+    card_text = element.text()
     emails = extract_emails(card_text, base_domain)
     # Also check mailto links
-    for a_tag in element.find_all("a", href=True):
-        href = a_tag["href"]
+    for href in hrefs:
         if href.startswith("mailto:"):
             email = href.replace("mailto:", "").split("?")[0].strip()
             if _is_valid_contact_email(email, base_domain):
@@ -320,8 +566,7 @@ def _parse_contact_card(element, base_domain: str) -> dict[str, Any]:
 
     # Extract phone
     phones = extract_phones(card_text)
-    for a_tag in element.find_all("a", href=True):
-        href = a_tag["href"]
+    for href in hrefs:
         if href.startswith("tel:"):
             phone = href.replace("tel:", "").strip()
             phones.insert(0, phone)
@@ -330,32 +575,42 @@ def _parse_contact_card(element, base_domain: str) -> dict[str, Any]:
         contact["phone"] = phones[0]
 
     # Extract photo URL
-    img = element.select_one("img")
-    if img and img.get("src"):
-        contact["photo_url"] = img["src"]
+    if img and img.attributes.get("src"):
+        contact["photo_url"] = img.attributes["src"]
 
     return contact
 
 
-def _extract_flat_contacts(soup: BeautifulSoup, html: str, base_domain: str) -> list[dict[str, Any]]:
+def _extract_flat_contacts(tree: LexborHTMLParser, html: str, base_domain: str) -> list[dict[str, Any]]:
     """Fallback: extract contacts as flat lists of emails/phones/names."""
     contacts: list[dict[str, Any]] = []
 
-    emails = extract_emails(html, base_domain)
+    emails = extract_emails(html, base_domain)[:10]
+    if not emails:
+        return contacts
+
+    # The name/title lookups only look at text nodes containing an email, so stream
+    # the document once and keep just those rather than a wrapper per text node
+    text_nodes: list[LexborNode] = []
+    for node in tree.root.traverse(include_text=True):
+        if node.tag == "-text":
+            text = node.text_content
+            if any(email in text for email in emails):
+                text_nodes.append(node)
 
     # Try to find names near emails
-    for email in emails[:10]:
+    for email in emails:
         contact: dict[str, Any] = {"email": email, "source": "crawl"}
 
         # Look for name near the email in the HTML
-        name = _find_name_near_email(soup, email)
+        name = _find_name_near_email(text_nodes, email)
         if name:
             contact["name"] = name
 
         # Look for title near the email
-        title = _find_title_near_email(soup, email)
+        title = _find_title_near_email(text_nodes, email)
         if title:
-            contact["title"] = title
+            contact["title"] = sys.intern(title)
 
         contacts.append(contact)
 
@@ -391,7 +646,7 @@ def extract_phones(text: str) -> list[str]:
 
     for match in PHONE_REGEX.finditer(text):
         phone = match.group().strip()
-        digits = re.sub(r"\D", "", phone)
+        digits = phone.translate(_PHONE_FORMATTING_DELETE)
 
         if len(digits) < 10 or len(digits) > 11:
             continue
@@ -404,6 +659,7 @@ def extract_phones(text: str) -> list[str]:
     return phones
 
 
+@lru_cache(maxsize=1024)
 def _normalize_domain(url_or_domain: str) -> str:
     """Extract clean domain from a URL or domain string."""
     d = url_or_domain.lower().strip()
@@ -517,31 +773,34 @@ def _looks_like_title(text: str) -> bool:
     return any(kw in text_lower for kw in title_keywords)
 
 
-def _find_name_near_email(soup: BeautifulSoup, email: str) -> str:
+def _find_name_near_email(text_nodes: list[LexborNode], email: str) -> str:
     """Try to find a person's name near an email in the document."""
-    # Find elements containing the email
-    for el in soup.find_all(string=re.compile(re.escape(email))):
+    # Find text containing the email
+    for el in text_nodes:
+        if email not in el.text_content:
+            continue
         parent = el.parent
         if parent:
             # Look at siblings and parent for name-like headings
-            for sibling in parent.parent.children if parent.parent else []:
-                if hasattr(sibling, "name") and sibling.name in ("h2", "h3", "h4", "h5", "strong"):
-                    name = sibling.get_text(strip=True)
+            for sibling in parent.parent.iter() if parent.parent else []:
+                if sibling.tag in _NAME_HEADING_TAGS:
+                    name = sibling.text(separator="", strip=True)
                     if name and len(name) > 2 and len(name) < 80:
                         return name
     return ""
 
 
-def _find_title_near_email(soup: BeautifulSoup, email: str) -> str:
+def _find_title_near_email(text_nodes: list[LexborNode], email: str) -> str:
     """Try to find a job title near an email in the document."""
-    for el in soup.find_all(string=re.compile(re.escape(email))):
+    for el in text_nodes:
+        if email not in el.text_content:
+            continue
         parent = el.parent
         if parent and parent.parent:
-            for sibling in parent.parent.children:
-                if hasattr(sibling, "get_text"):
-                    text = sibling.get_text(strip=True)
-                    if text and _looks_like_title(text) and text.lower() != email:
-                        return text
+            for sibling in parent.parent.iter(include_text=True):
+                text = sibling.text(separator="", strip=True)
+                if text and _looks_like_title(text) and text.lower() != email:
+                    return text
     return ""
 
 
@@ -8,8 +8,68 @@ from bs4 import BeautifulSoup
 
 from config.platforms import PLATFORM_SIGNATURES
 
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
 logger = logging.getLogger(__name__)
 
+# (platform, signature) pairs in priority order: dict order, then list order
+_SIGNATURES: tuple[tuple[str, str], ...] = tuple(
+    (platform_name, signature) for platform_name, info in PLATFORM_SIGNATURES.items() for signature in info.signatures
+)
+
+
+def _build_signature_automaton():
+    """Build one Aho-Corasick automaton over every lowercased signature, valued by priority."""
+    automaton = ahocorasick.Automaton()
+    for priority, (_platform_name, signature) in enumerate(_SIGNATURES):
+        key = signature.lower()
+        # Duplicate signatures keep their highest-priority (earliest) entry
+        if key not in automaton:
+            automaton.add_word(key, priority)
+    automaton.make_automaton()
+    return automaton
+
+
+_SIGNATURE_AUTOMATON = _build_signature_automaton() if ahocorasick is not None and _SIGNATURES else None
+
+# Broader CMS markers, checked in order; each CMS's alternatives share one compiled pattern
+_CMS_PATTERNS: tuple[tuple[str, re.Pattern[str]], ...] = (
+    ("WordPress", re.compile(r"wp-content|wp-includes|wordpress")),
+    ("Drupal", re.compile(r"drupal\.js|/sites/default/files")),
+    ("Squarespace", re.compile(r"squarespace\.com|sqsp\.com")),
+    ("Wix", re.compile(r"wix\.com|parastorage\.com")),
+)
+
+# Dealership WordPress theme slugs, matched against wp-content/themes/ asset URLs
+_WP_THEME_PATTERNS: tuple[tuple[str, re.Pattern[str]], ...] = (
+    ("WordPress (Jesuspended Theme)", re.compile(r"theme-flavor|flavor-theme")),
+    ("WordPress (AutoTrader Theme)", re.compile(r"theme-developer|developer-theme")),
+)
+
+
+def _find_signature(text_lower: str) -> Optional[tuple[str, str]]:
+    """Return the highest-priority (platform, signature) found in lowercased text.
+
+    With pyahocorasick installed every signature is matched in a single pass over
+    the text; otherwise each signature is checked with a substring search.
+    """
+    if _SIGNATURE_AUTOMATON is None:
+        for platform_name, signature in _SIGNATURES:
+            if signature.lower() in text_lower:
+                return platform_name, signature
+        return None
+
+    best = len(_SIGNATURES)
+    for _end, priority in _SIGNATURE_AUTOMATON.iter(text_lower):
+        if priority < best:
+            best = priority
+            if not best:
+                break
+    return _SIGNATURES[best] if best < len(_SIGNATURES) else None
+
 
 class PlatformDetector:
     """Detects the website platform a dealership uses."""
@@ -37,14 +97,14 @@ class PlatformDetector:
             return {"platform": generator, "confidence": 0.95, "method": "meta_generator"}
 
         # Check HTML source for platform signatures
-        for platform_name, info in PLATFORM_SIGNATURES.items():
-            for signature in info.signatures:
-                if signature.lower() in html_lower:
-                    return {
-                        "platform": platform_name,
-                        "confidence": 0.85,
-                        "method": f"signature:{signature}",
-                    }
+        match = _find_signature(html_lower)
+        if match:
+            platform_name, signature = match
+            return {
+                "platform": platform_name,
+                "confidence": 0.85,
+                "method": f"signature:{signature}",
+            }
 
         # Check script/link URLs for known CDN patterns
         platform = self._check_asset_urls(soup)
@@ -87,45 +147,25 @@ class PlatformDetector:
         for link in soup.find_all("link", href=True):
             urls.append(link["href"].lower())
 
-        all_urls = " ".join(urls)
-
-        for platform_name, info in PLATFORM_SIGNATURES.items():
-            for signature in info.signatures:
-                if signature.lower() in all_urls:
-                    return platform_name
-
-        return None
+        match = _find_signature(" ".join(urls))
+        return match[0] if match else None
 
     def _check_cms_patterns(self, html_lower: str, soup: BeautifulSoup) -> Optional[str]:
         """Check for broader CMS patterns."""
-        patterns = {
-            "WordPress": [r"wp-content", r"wp-includes", r"wordpress"],
-            "Drupal": [r"drupal\.js", r"/sites/default/files"],
-            "Squarespace": [r"squarespace\.com", r"sqsp\.com"],
-            "Wix": [r"wix\.com", r"parastorage\.com"],
-        }
-
-        for cms_name, regexes in patterns.items():
-            for regex in regexes:
-                if re.search(regex, html_lower):
-                    return cms_name
+        for cms_name, pattern in _CMS_PATTERNS:
+            if pattern.search(html_lower):
+                return cms_name
 
         return None
 
     def _check_wp_dealer_themes(self, html_lower: str, soup: BeautifulSoup) -> Optional[str]:
         """Check for WordPress themes commonly used by dealerships."""
-        theme_patterns = {
-            "WordPress (Jesuspended Theme)": [r"theme-flavor", r"flavor-theme"],
-            "WordPress (AutoTrader Theme)": [r"theme-developer", r"developer-theme"],
-        }
-
         # Look in link/script URLs for theme slugs
         for el in soup.find_all(["link", "script"], {"href": True, "src": True}):
             url = (el.get("href") or el.get("src") or "").lower()
             if "wp-content/themes/" in url:
-                for theme_name, patterns in theme_patterns.items():
-                    for pattern in patterns:
-                        if re.search(pattern, url):
-                            return theme_name
+                for theme_name, pattern in _WP_THEME_PATTERNS:
+                    if pattern.search(url):
+                        return theme_name
 
         return None
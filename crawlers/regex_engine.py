@@ -0,0 +1,21 @@
+"""Regex compilation for hot-path crawler patterns: RE2 when installed, stdlib re otherwise."""
+
+import re
+
+try:
+    import re2 as _re2
+except ImportError:
+    _re2 = re
+
+# Python's \s is Unicode-aware but RE2's is ASCII-only (no &nbsp;), so patterns spell out
+# Python's whitespace set to behave the same on either engine
+WHITESPACE_CHARS = "\t\n\x0b\x0c\r\x1c-\x1f \x85\xa0\u1680\u2000-\u200a\u2028\u2029\u202f\u205f\u3000"
+
+
+def compile_pattern(pattern: str):
+    """Compile with RE2 when installed, matching the same text as ``re`` would.
+
+    RE2 takes no flags (use inline ``(?i)``), its ``\\d`` is ASCII-only (write ``[0-9]``),
+    and ``\\s`` may only appear inside a character class.
+    """
+    return _re2.compile(pattern.replace(r"\s", WHITESPACE_CHARS))
@@ -9,23 +9,38 @@ from pyppeteer.page import Page
 
 logger = logging.getLogger(__name__)
 
-# Realistic user agents to rotate through
-USER_AGENTS = [
+# Realistic user agents to rotate through (immutable: shared by every page and request)
+USER_AGENTS = (
     "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/121.0.0.0 Safari/537.36",
     "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/122.0.0.0 Safari/537.36",
     "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 Chrome/121.0.0.0 Safari/537.36",
     "Mozilla/5.0 (Windows NT 10.0; Win64; x64; rv:122.0) Gecko/20100101 Firefox/122.0",
     "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/605.1.15 Version/17.2 Safari/605.1.15",
-]
+)
 
 # Realistic viewport sizes
-VIEWPORTS = [
+VIEWPORTS = (
     {"width": 1280, "height": 900},
     {"width": 1366, "height": 768},
     {"width": 1440, "height": 900},
     {"width": 1536, "height": 864},
     {"width": 1920, "height": 1080},
-]
+)
+
+# Browser-like request headers set on every page; built once, pyppeteer copies them
+PAGE_HEADERS = {
+    "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,image/apng,*/*;q=0.8",
+    "Accept-Language": "en-US,en;q=0.9",
+    "Accept-Encoding": "gzip, deflate, br",
+    "DNT": "1",
+    "Connection": "keep-alive",
+    "Upgrade-Insecure-Requests": "1",
+    "Sec-Fetch-Dest": "document",
+    "Sec-Fetch-Mode": "navigate",
+    "Sec-Fetch-Site": "none",
+    "Sec-Fetch-User": "?1",
+    "Cache-Control": "max-age=0",
+}
 
 # Stealth JS to inject before any page scripts run
 STEALTH_JS = """() => {
@@ -158,23 +173,7 @@ async def apply_stealth(page: Page) -> None:
     await page.setViewport(viewport)
 
     # Set extra HTTP headers
-    await page.setExtraHTTPHeaders(
-        {
-            "Accept": (
-                "text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,image/apng,*/*;q=0.8"
-            ),
-            "Accept-Language": "en-US,en;q=0.9",
-            "Accept-Encoding": "gzip, deflate, br",
-            "DNT": "1",
-            "Connection": "keep-alive",
-            "Upgrade-Insecure-Requests": "1",
-            "Sec-Fetch-Dest": "document",
-            "Sec-Fetch-Mode": "navigate",
-            "Sec-Fetch-Site": "none",
-            "Sec-Fetch-User": "?1",
-            "Cache-Control": "max-age=0",
-        }
-    )
+    await page.setExtraHTTPHeaders(PAGE_HEADERS)
 
     # Inject stealth JS before any page scripts
     await page.evaluateOnNewDocument(STEALTH_JS)
@@ -132,15 +132,18 @@ class FallbackChain:
                 merged.append(contact)
 
         # Add Apollo contacts that don't duplicate
+        merged_names = {(c.get("name") or "").lower().strip() for c in merged}
         for contact in apollo:
             email = (contact.get("email") or "").lower().strip()
+            name = (contact.get("name") or "").lower().strip()
             if email and email not in seen_emails:
                 seen_emails.add(email)
                 merged.append(contact)
+                merged_names.add(name)
             elif not email:
                 # Check name-based dedup
-                name = (contact.get("name") or "").lower().strip()
-                if name and not any((c.get("name") or "").lower().strip() == name for c in merged):
+                if name and name not in merged_names:
                     merged.append(contact)
+                    merged_names.add(name)
 
         return merged
@@ -8,8 +8,8 @@ from typing import Any, Callable, Optional
 from services.apollo_api import ApolloAPIService
 from services.database_service import DatabaseService
 from services.domain_utils import extract_company_name, extract_domain
-from services.role_classifier import RoleClassifier, RoleFilterCriteria
-from services.validation import ContactValidator
+from services.role_classifier import DEFAULT_CLASSIFIER, RoleClassifier, RoleFilterCriteria
+from services.validation import CONFIDENCE_FACTOR_FIELDS, ContactValidator
 
 logger = logging.getLogger(__name__)
 
@@ -37,8 +37,8 @@ class IntelPipeline:
     ):
         self.apollo = apollo_service
         self.db = db_service
-        self.validator = validator or ContactValidator(enable_email_verification=False)
-        self.role_classifier = role_classifier or RoleClassifier()
+        self.role_classifier = role_classifier or DEFAULT_CLASSIFIER
+        self.validator = validator or ContactValidator(role_classifier=self.role_classifier)
         self.browser_manager = browser_manager
         self.staff_crawler = staff_crawler
         self.inventory_crawler = inventory_crawler
@@ -498,15 +498,18 @@ class IntelPipeline:
             elif not email:
                 merged.append(contact)
 
+        merged_names = {(c.get("name") or "").lower().strip() for c in merged}
         for contact in apollo:
             email = (contact.get("email") or "").lower().strip()
+            name = (contact.get("name") or "").lower().strip()
             if email and email not in seen_emails:
                 seen_emails.add(email)
                 merged.append(contact)
+                merged_names.add(name)
             elif not email:
-                name = (contact.get("name") or "").lower().strip()
-                if name and not any((c.get("name") or "").lower().strip() == name for c in merged):
+                if name and name not in merged_names:
                     merged.append(contact)
+                    merged_names.add(name)
 
         return merged
 
@@ -517,18 +520,17 @@ class IntelPipeline:
         company_name: str,
     ) -> list[dict[str, Any]]:
         """Validate and score a list of contacts."""
-        validated = []
-
-        for person in people:
-            role_classification = person.get("role_classification")
-            if not role_classification:
-                role_classification = self.role_classifier.classify_role(person.get("title", ""), company_name)
+        # The validator reads the company from each contact; keep any the source already set
+        contacts = [{"company_domain": domain, "company_name": company_name, **person} for person in people]
+        validations = [self.validator.validate_contact(contact) for contact in contacts]
+        scores, factors = self.validator.calculate_confidence_batch(contacts, validations)
 
-            contact_validation = self.validator.validate_contact(person, domain)
-            confidence_score, confidence_factors = self.validator.calculate_confidence_score(
-                person, contact_validation, domain, role_classification
-            )
-            quality_flags = self.validator.get_quality_flags(contact_validation)
+        validated = []
+        for person, contact, validation, score, factor_row in zip(
+            people, contacts, validations, scores.tolist(), factors.tolist()
+        ):
+            quality_flags = self.validator.get_quality_flags(contact, validation)
+            confidence_factors = dict(zip(CONFIDENCE_FACTOR_FIELDS, factor_row))
 
             validated.append(
                 {
@@ -537,14 +539,9 @@ class IntelPipeline:
                     "email": person.get("email", ""),
                     "phone": person.get("phone", ""),
                     "linkedin_url": person.get("linkedin_url", ""),
-                    "confidence_score": confidence_score,
+                    "confidence_score": score,
                     "quality_flags": "; ".join(quality_flags) if quality_flags else "",
-                    "data_completeness": confidence_factors.data_completeness,
-                    "domain_consistency": confidence_factors.domain_consistency,
-                    "professional_title": confidence_factors.professional_title,
-                    "linkedin_presence": confidence_factors.linkedin_presence,
-                    "data_consistency": confidence_factors.data_consistency,
-                    "email_quality": confidence_factors.email_quality,
+                    **confidence_factors,
                     "source": person.get("source", "apollo"),
                 }
             )
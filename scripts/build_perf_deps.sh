@@ -0,0 +1,54 @@
+#!/usr/bin/env bash
+# Rebuild the C-extension parsers on the scrape hot path with profile-guided
+# optimization (PGO) and link-time optimization (LTO).
+#
+#   1. Build lxml, selectolax and pyahocorasick from source with -fprofile-generate.
+#   2. Run the test suite, which parses realistic dealer pages, as the training workload.
+#   3. Rebuild the same source trees with -fprofile-use and install them.
+#
+# Needs gcc, the libxml2/libxslt headers and network access to download sdists.
+# orjson (Rust) and google-re2 (a wrapper around the system libre2) are not rebuilt.
+#
+# Usage: scripts/build_perf_deps.sh [workdir]
+set -euo pipefail
+
+PACKAGES=(lxml selectolax pyahocorasick)
+REPO_DIR="$(cd "$(dirname "${BASH_SOURCE[0]}")/.." && pwd)"
+WORK_DIR="${1:-${TMPDIR:-/tmp}/dealership-intel-pgo}"
+SRC_DIR="${WORK_DIR}/src"
+PROFILE_DIR="${WORK_DIR}/profiles"
+PYTHON="${PYTHON:-python}"
+
+rm -rf "${WORK_DIR}"
+mkdir -p "${SRC_DIR}" "${PROFILE_DIR}"
+
+# Unpack each sdist into a fixed directory: gcc keys profile data on object file
+# paths, so both builds must compile the same tree.
+for pkg in "${PACKAGES[@]}"; do
+    "${PYTHON}" -m pip download --no-binary :all: --no-deps --dest "${WORK_DIR}/sdist" "${pkg}"
+done
+for archive in "${WORK_DIR}"/sdist/*.tar.gz; do
+    tar -xzf "${archive}" -C "${SRC_DIR}"
+done
+
+build_all() {
+    for tree in "${SRC_DIR}"/*/; do
+        rm -rf "${tree}build"
+        "${PYTHON}" -m pip install --force-reinstall --no-deps --no-cache-dir "${tree}"
+    done
+}
+
+echo "==> Instrumented build"
+CFLAGS="-O3 -flto -fprofile-generate=${PROFILE_DIR} -fprofile-update=atomic" \
+LDFLAGS="-flto -fprofile-generate=${PROFILE_DIR}" \
+    build_all
+
+echo "==> Training run"
+(cd "${REPO_DIR}" && "${PYTHON}" -m pytest -q -n 0 -p no:cacheprovider)
+
+echo "==> Optimized build"
+CFLAGS="-O3 -flto -fprofile-use=${PROFILE_DIR} -fprofile-partial-training -Wno-missing-profile" \
+LDFLAGS="-flto -fprofile-use=${PROFILE_DIR}" \
+    build_all
+
+echo "==> Done; verify with: ${PYTHON} -m pytest -q"
@@ -1,14 +1,29 @@
 """AI CRM API integration - push dealership intelligence to the CRM."""
 
+import asyncio
+import concurrent.futures
 import json
 import logging
 from datetime import datetime
 from typing import Any, Optional
 
+import httpx
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 from config.settings import get_settings
 
+try:
+    import orjson
+
+    _json_dumps = orjson.dumps
+except ImportError:
+
+    def _json_dumps(obj: Any) -> bytes:
+        return json.dumps(obj).encode()
+
+
 logger = logging.getLogger(__name__)
 
 
@@ -21,9 +36,19 @@ class CRMSyncService:
         self.api_key = api_key or settings.crm_api_key
 
         self.session = requests.Session()
+        # Keep enough pooled keep-alive connections for parallel bulk syncs
+        adapter = HTTPAdapter(
+            pool_connections=32,
+            pool_maxsize=64,
+            max_retries=Retry(total=3, backoff_factor=0.3, status_forcelist=[502, 503, 504]),
+        )
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+        self._api_headers = {"Content-Type": "application/json"}
         if self.api_key:
-            self.session.headers.update({"X-API-Key": self.api_key})
-        self.session.headers.update({"Content-Type": "application/json"})
+            self._api_headers["X-API-Key"] = self.api_key
+        self.session.headers.update(self._api_headers)
+        self.session.headers.update({"Connection": "keep-alive", "Accept-Encoding": "gzip"})
 
     @property
     def is_configured(self) -> bool:
@@ -76,9 +101,89 @@ class CRMSyncService:
             logger.error(f"CRM sync failed for {domain}: {e}")
             return None
 
-    def _upsert_dealership(self, intel_data: dict[str, Any]) -> Optional[int]:
-        """Create or update a dealership record in the CRM."""
-        payload = {
+    def sync_dealerships(
+        self, intel_batch: list[dict[str, Any]], max_workers: int = 16
+    ) -> list[Optional[dict[str, Any]]]:
+        """Sync many dealerships in parallel over the shared pooled session.
+
+        Args:
+            intel_batch: Intelligence results from the pipeline.
+            max_workers: Number of concurrent syncs.
+
+        Returns:
+            One sync_dealership result (or None on failure) per input, in order.
+        """
+        if not intel_batch:
+            return []
+        with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return list(executor.map(self.sync_dealership, intel_batch))
+
+    async def sync_dealership_async(
+        self, intel_data: dict[str, Any], client: Optional[httpx.AsyncClient] = None
+    ) -> Optional[dict[str, Any]]:
+        """Async variant of sync_dealership that posts contacts concurrently.
+
+        Once the dealership id is known, the client upserts and the activity log
+        are sent together over one HTTP/2 connection.
+
+        Args:
+            intel_data: Full intelligence result from the pipeline.
+            client: Optional shared client from create_async_client, so bulk syncs
+                reuse one connection; a short-lived client is opened otherwise.
+
+        Returns:
+            CRM response dict or None on failure.
+        """
+        if not self.is_configured:
+            logger.warning("CRM not configured - skipping sync")
+            return None
+
+        domain = intel_data.get("domain", "")
+        if not domain:
+            logger.warning("No domain in intel data - skipping CRM sync")
+            return None
+
+        if client is None:
+            async with self.create_async_client() as own_client:
+                return await self.sync_dealership_async(intel_data, own_client)
+
+        try:
+            # Step 1: Upsert dealership record
+            dealership_id = await self._upsert_dealership_async(client, intel_data)
+            if not dealership_id:
+                return None
+
+            # Steps 2 and 3: sync contacts as clients and log the activity in parallel
+            contacts = intel_data.get("contacts", [])
+            *client_ids, _ = await asyncio.gather(
+                *(self._upsert_client_async(client, contact, dealership_id) for contact in contacts),
+                self._log_activity_async(client, dealership_id, intel_data),
+            )
+
+            result = {
+                "dealership_id": dealership_id,
+                "clients_synced": sum(1 for client_id in client_ids if client_id),
+                "domain": domain,
+            }
+            logger.info(f"CRM sync complete for {domain}: {result}")
+            return result
+
+        except Exception as e:
+            logger.error(f"CRM sync failed for {domain}: {e}")
+            return None
+
+    def create_async_client(self) -> httpx.AsyncClient:
+        """Create an HTTP/2 client carrying the CRM API headers, for sync_dealership_async."""
+        return httpx.AsyncClient(
+            http2=True,
+            headers=self._api_headers,
+            limits=httpx.Limits(max_connections=32),
+            timeout=15,
+        )
+
+    @staticmethod
+    def _dealership_payload(intel_data: dict[str, Any]) -> dict[str, Any]:
+        return {
             "name": intel_data.get("company_name", ""),
             "website": intel_data.get("original_website", ""),
             "phone": intel_data.get("company_phone", ""),
@@ -87,11 +192,49 @@ class CRMSyncService:
             "lead_source": "DealershipIntel",
         }
 
+    @staticmethod
+    def _client_payload(contact: dict[str, Any], dealership_id: int) -> dict[str, Any]:
+        return {
+            "name": contact.get("name", ""),
+            "email": contact.get("email", ""),
+            "phone": contact.get("phone", ""),
+            "title": contact.get("title", ""),
+            "dealershipId": dealership_id,
+            "lead_source": "DealershipIntel",
+        }
+
+    @staticmethod
+    def _activity_payload(dealership_id: int, intel_data: dict[str, Any]) -> dict[str, Any]:
+        metadata = {
+            "domain": intel_data.get("domain", ""),
+            "industry": intel_data.get("industry", ""),
+            "company_size": intel_data.get("company_size", ""),
+            "contacts_found": len(intel_data.get("contacts", [])),
+            "platform": intel_data.get("platform", {}).get("platform", ""),
+            "new_inventory": intel_data.get("inventory", {}).get("new_count"),
+            "used_inventory": intel_data.get("inventory", {}).get("used_count"),
+            "social_links": intel_data.get("social_links", {}),
+            "reviews": intel_data.get("reviews", []),
+            "scan_timestamp": datetime.now().isoformat(),
+        }
+
+        return {
+            "dealershipId": dealership_id,
+            "type": "note",
+            "subject": "DealershipIntel Scan",
+            "description": f"Intelligence scan completed for {intel_data.get('company_name', 'Unknown')}",
+            "metadata": json.dumps(metadata),
+        }
+
+    def _upsert_dealership(self, intel_data: dict[str, Any]) -> Optional[int]:
+        """Create or update a dealership record in the CRM."""
+        payload = self._dealership_payload(intel_data)
+
         try:
             # Try domain-based lookup/upsert first
             response = self.session.post(
                 f"{self.api_url}/dealerships/by-domain",
-                json={"domain": intel_data.get("domain", ""), **payload},
+                data=_json_dumps({"domain": intel_data.get("domain", ""), **payload}),
                 timeout=15,
             )
 
@@ -103,7 +246,7 @@ class CRMSyncService:
             if response.status_code == 404:
                 response = self.session.post(
                     f"{self.api_url}/dealerships",
-                    json=payload,
+                    data=_json_dumps(payload),
                     timeout=15,
                 )
                 if response.ok:
@@ -119,19 +262,12 @@ class CRMSyncService:
 
     def _upsert_client(self, contact: dict[str, Any], dealership_id: int) -> Optional[int]:
         """Create or update a client (contact) record in the CRM."""
-        payload = {
-            "name": contact.get("name", ""),
-            "email": contact.get("email", ""),
-            "phone": contact.get("phone", ""),
-            "title": contact.get("title", ""),
-            "dealershipId": dealership_id,
-            "lead_source": "DealershipIntel",
-        }
+        payload = self._client_payload(contact, dealership_id)
 
         try:
             response = self.session.post(
                 f"{self.api_url}/clients",
-                json=payload,
+                data=_json_dumps(payload),
                 timeout=15,
             )
 
@@ -148,31 +284,12 @@ class CRMSyncService:
 
     def _log_activity(self, dealership_id: int, intel_data: dict[str, Any]) -> None:
         """Log intelligence findings as an activity in the CRM."""
-        metadata = {
-            "domain": intel_data.get("domain", ""),
-            "industry": intel_data.get("industry", ""),
-            "company_size": intel_data.get("company_size", ""),
-            "contacts_found": len(intel_data.get("contacts", [])),
-            "platform": intel_data.get("platform", {}).get("platform", ""),
-            "new_inventory": intel_data.get("inventory", {}).get("new_count"),
-            "used_inventory": intel_data.get("inventory", {}).get("used_count"),
-            "social_links": intel_data.get("social_links", {}),
-            "reviews": intel_data.get("reviews", []),
-            "scan_timestamp": datetime.now().isoformat(),
-        }
-
-        payload = {
-            "dealershipId": dealership_id,
-            "type": "note",
-            "subject": "DealershipIntel Scan",
-            "description": f"Intelligence scan completed for {intel_data.get('company_name', 'Unknown')}",
-            "metadata": json.dumps(metadata),
-        }
+        payload = self._activity_payload(dealership_id, intel_data)
 
         try:
             response = self.session.post(
                 f"{self.api_url}/activities",
-                json=payload,
+                data=_json_dumps(payload),
                 timeout=15,
             )
 
@@ -182,6 +299,70 @@ class CRMSyncService:
         except requests.RequestException as e:
             logger.error(f"Activity log request failed: {e}")
 
+    async def _upsert_dealership_async(self, client: httpx.AsyncClient, intel_data: dict[str, Any]) -> Optional[int]:
+        """Async variant of _upsert_dealership."""
+        payload = self._dealership_payload(intel_data)
+
+        try:
+            # Try domain-based lookup/upsert first
+            response = await client.post(
+                f"{self.api_url}/dealerships/by-domain",
+                content=_json_dumps({"domain": intel_data.get("domain", ""), **payload}),
+            )
+
+            if response.is_success:
+                data = response.json()
+                return data.get("id") or data.get("dealership_id")
+
+            # Fallback to standard create
+            if response.status_code == 404:
+                response = await client.post(f"{self.api_url}/dealerships", content=_json_dumps(payload))
+                if response.is_success:
+                    data = response.json()
+                    return data.get("id") or data.get("dealership_id")
+
+            logger.warning(f"Dealership upsert failed: HTTP {response.status_code}")
+            return None
+
+        except httpx.HTTPError as e:
+            logger.error(f"Dealership upsert request failed: {e}")
+            return None
+
+    async def _upsert_client_async(
+        self, client: httpx.AsyncClient, contact: dict[str, Any], dealership_id: int
+    ) -> Optional[int]:
+        """Async variant of _upsert_client."""
+        try:
+            response = await client.post(
+                f"{self.api_url}/clients", content=_json_dumps(self._client_payload(contact, dealership_id))
+            )
+
+            if response.is_success:
+                data = response.json()
+                return data.get("id") or data.get("client_id")
+
+            logger.warning(f"Client upsert failed: HTTP {response.status_code}")
+            return None
+
+        except httpx.HTTPError as e:
+            logger.error(f"Client upsert request failed: {e}")
+            return None
+
+    async def _log_activity_async(
+        self, client: httpx.AsyncClient, dealership_id: int, intel_data: dict[str, Any]
+    ) -> None:
+        """Async variant of _log_activity."""
+        try:
+            response = await client.post(
+                f"{self.api_url}/activities", content=_json_dumps(self._activity_payload(dealership_id, intel_data))
+            )
+
+            if not response.is_success:
+                logger.warning(f"Activity log failed: HTTP {response.status_code}")
+
+        except httpx.HTTPError as e:
+            logger.error(f"Activity log request failed: {e}")
+
     def test_connection(self) -> dict[str, Any]:
         """Test the CRM API connection."""
         if not self.is_configured:
@@ -2,32 +2,53 @@
 
 import json
 import logging
+from functools import lru_cache
 from typing import Any, Optional
 
 import gspread
 import pandas as pd
 from google.oauth2.service_account import Credentials
 
+try:
+    import orjson
+
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
 logger = logging.getLogger(__name__)
 
+SCOPES = [
+    "https://www.googleapis.com/auth/spreadsheets",
+    "https://www.googleapis.com/auth/drive",
+]
+
+
+@lru_cache(maxsize=8)
+def _authorize(creds_json: str) -> gspread.Client:
+    """Build one authorized client per service account for the process lifetime.
+
+    Keyed on the credentials JSON text and parsed here, so the private key is only
+    held for as long as its client stays cached.
+
+    google-auth refreshes the OAuth token on the client's session when it nears
+    expiry, so the cached client never needs to be re-authorized.
+    """
+    credentials = Credentials.from_service_account_info(_json_loads(creds_json), scopes=SCOPES)
+    return gspread.authorize(credentials)
+
 
 class GoogleSheetsService:
     def __init__(self, service_account_json: str):
         try:
             if isinstance(service_account_json, str):
-                credentials_dict = json.loads(service_account_json)
+                creds_json = service_account_json
             else:
-                credentials_dict = service_account_json
-
-            scopes = [
-                "https://www.googleapis.com/auth/spreadsheets",
-                "https://www.googleapis.com/auth/drive",
-            ]
+                creds_json = json.dumps(service_account_json, sort_keys=True)
 
-            credentials = Credentials.from_service_account_info(credentials_dict, scopes=scopes)
-            self.gc = gspread.authorize(credentials)
+            self.gc = _authorize(creds_json)
 
-        except json.JSONDecodeError as e:
+        except json.JSONDecodeError as e:  # orjson.JSONDecodeError subclasses this
             raise ValueError(f"Invalid JSON credentials: {e}")
         except Exception as e:
             raise RuntimeError(f"Error initializing Google Sheets service: {e}")
@@ -60,7 +81,7 @@ class GoogleSheetsService:
             worksheet = spreadsheet.get_worksheet(0)
             worksheet.clear()
 
-            data = [df.columns.tolist()] + df.fillna("").values.tolist()
+            data = [df.columns.tolist()] + df.to_numpy(dtype=object, na_value="").tolist()
             worksheet.update("A1", data)
             spreadsheet.share("", perm_type="anyone", role="reader")
 
@@ -74,7 +95,7 @@ class GoogleSheetsService:
         try:
             sheet = self.gc.open_by_url(sheet_url)
             worksheet = sheet.worksheet(worksheet_name) if worksheet_name else sheet.get_worksheet(0)
-            data = df.fillna("").values.tolist()
+            data = df.to_numpy(dtype=object, na_value="").tolist()
             worksheet.append_rows(data)
 
         except Exception as e:
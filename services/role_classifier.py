@@ -4,10 +4,86 @@ import logging
 import re
 from dataclasses import dataclass
 from enum import Enum
-from typing import Any, Optional
+from typing import Any, Callable, Iterable, Optional
+
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
 
 logger = logging.getLogger(__name__)
 
+# Words whose presence in both title and pattern boosts the overlap score
+_KEY_WORDS = frozenset({"manager", "director", "president", "ceo", "owner", "vice", "chief"})
+
+# Title words dropped before matching, and abbreviations expanded by a single lookup per word
+_TITLE_NOISE_WORDS = frozenset({"the", "a", "an", "of", "and", "&", "at", "for", "in", "on"})
+_TITLE_ABBREVIATIONS = {
+    "mgr": "manager",
+    "dir": "director",
+    "coord": "coordinator",
+    "asst": "assistant",
+    "sr": "senior",
+    "jr": "junior",
+    "vp": "vice president",
+    "svp": "senior vice president",
+    "evp": "executive vice president",
+    "gm": "general manager",
+}
+_NON_WORD_CHARS_RE = re.compile(r"[^\w]")
+
+# Company-name substrings that mark a dealership
+_DEALERSHIP_COMPANY_INDICATORS = frozenset(
+    {
+        "auto",
+        "automotive",
+        "car",
+        "cars",
+        "dealership",
+        "dealer",
+        "motors",
+        "honda",
+        "toyota",
+        "ford",
+        "chevrolet",
+        "bmw",
+        "mercedes",
+        "audi",
+        "nissan",
+        "volkswagen",
+        "hyundai",
+        "kia",
+        "mazda",
+        "subaru",
+        "lexus",
+        "acura",
+        "infiniti",
+        "cadillac",
+        "buick",
+        "gmc",
+    }
+)
+
+
+def _substring_finder(words: Iterable[str]) -> Callable[[str], set[str]]:
+    """Build a function returning which of the given words occur in a text.
+
+    With pyahocorasick installed all words are found in one pass over the text;
+    otherwise each word is checked with a substring search.
+    """
+    words = tuple(words)
+    if ahocorasick is None or not all(words):
+        return lambda text: {word for word in words if word in text}
+
+    automaton = ahocorasick.Automaton()
+    for word in words:
+        automaton.add_word(word, word)
+    automaton.make_automaton()
+    return lambda text: {word for _end, word in automaton.iter(text)}
+
+
+_find_dealership_indicators = _substring_finder(_DEALERSHIP_COMPANY_INDICATORS)
+
 
 class SeniorityLevel(Enum):
     C_SUITE = "C-Suite"
@@ -201,6 +277,42 @@ class RoleClassifier:
             "seasonal",
         }
 
+        # Seniority tables in check order; on equal match scores the earlier table wins
+        self._seniority_tables = (
+            (self.c_suite_patterns, SeniorityLevel.C_SUITE),
+            (self.senior_executive_patterns, SeniorityLevel.SENIOR_EXECUTIVE),
+            (self.director_patterns, SeniorityLevel.DIRECTOR),
+            (self.management_patterns, SeniorityLevel.MANAGER),
+            (self.specialist_patterns, SeniorityLevel.SPECIALIST),
+            (self.coordinator_patterns, SeniorityLevel.COORDINATOR),
+        )
+
+        # First place each pattern appears in check order, so a classification is resolved
+        # from the candidate patterns alone instead of rescanning every table per title
+        self._pattern_first_match: dict[str, tuple[int, str, SeniorityLevel]] = {}
+        entries = (
+            (pattern, role_type, seniority)
+            for patterns_dict, seniority in self._seniority_tables
+            for role_type, patterns in patterns_dict.items()
+            for pattern in patterns
+        )
+        for position, (pattern, role_type, seniority) in enumerate(entries):
+            self._pattern_first_match.setdefault(pattern, (position, role_type, seniority))
+
+        # Pattern word sets are fixed, so split them once instead of on every score
+        self._pattern_words: dict[str, frozenset[str]] = {
+            pattern: frozenset(pattern.split()) for pattern in self._pattern_first_match
+        }
+
+        # A pattern scores above zero only if it shares a word with the title or is
+        # contained in it; these lookups find those candidates without scoring.
+        self._patterns_by_word: dict[str, list[str]] = {}
+        for pattern, words in self._pattern_words.items():
+            for word in words:
+                self._patterns_by_word.setdefault(word, []).append(pattern)
+        self._find_contained_patterns = _substring_finder(self._pattern_words)
+        self._find_negative_patterns = _substring_finder(self.negative_patterns)
+
     def classify_role(self, title: str, company_name: str = "") -> RoleClassification:
         """Classify a job title into role category and seniority level."""
         if not title or not isinstance(title, str):
@@ -219,28 +331,11 @@ class RoleClassifier:
                 dealership_specific=False,
             )
 
-        classification_attempts = [
-            (self.c_suite_patterns, SeniorityLevel.C_SUITE),
-            (self.senior_executive_patterns, SeniorityLevel.SENIOR_EXECUTIVE),
-            (self.director_patterns, SeniorityLevel.DIRECTOR),
-            (self.management_patterns, SeniorityLevel.MANAGER),
-            (self.specialist_patterns, SeniorityLevel.SPECIALIST),
-            (self.coordinator_patterns, SeniorityLevel.COORDINATOR),
-        ]
-
-        best_match = None
-        best_confidence = 0.0
-
-        for patterns_dict, seniority in classification_attempts:
-            match_result = self._find_best_pattern_match(normalized, patterns_dict)
-            if match_result and match_result["confidence"] > best_confidence:
-                best_match = {
-                    "seniority": seniority,
-                    "category": self._determine_category(match_result["role_type"], seniority),
-                    "confidence": match_result["confidence"],
-                    "keywords": match_result["keywords"],
-                }
-                best_confidence = match_result["confidence"]
+        candidates = self._candidate_patterns(normalized)
+        if not candidates:
+            return self._create_fallback_classification(original_title, normalized, company_name)
+
+        best_match = self._find_best_pattern_match(normalized, candidates)
 
         if best_match:
             dealership_specific = self._is_dealership_specific(normalized) or self._is_dealership_company(company_name)
@@ -260,66 +355,76 @@ class RoleClassifier:
         return self._create_fallback_classification(original_title, normalized, company_name)
 
     def _normalize_title(self, title: str) -> str:
-        normalized = re.sub(r"\s+", " ", title.lower().strip())
-        noise_words = ["the", "a", "an", "of", "and", "&", "at", "for", "in", "on"]
-        words = normalized.split()
-        filtered_words = [w for w in words if w not in noise_words]
-
-        abbreviations = {
-            "mgr": "manager",
-            "dir": "director",
-            "coord": "coordinator",
-            "asst": "assistant",
-            "sr": "senior",
-            "jr": "junior",
-            "vp": "vice president",
-            "svp": "senior vice president",
-            "evp": "executive vice president",
-            "gm": "general manager",
-        }
-
         expanded_words = []
-        for word in filtered_words:
-            clean_word = re.sub(r"[^\w]", "", word)
-            expanded_words.append(abbreviations.get(clean_word, clean_word))
+        for word in title.lower().split():
+            if word in _TITLE_NOISE_WORDS:
+                continue
+            clean_word = _NON_WORD_CHARS_RE.sub("", word)
+            expanded_words.append(_TITLE_ABBREVIATIONS.get(clean_word, clean_word))
 
         return " ".join(expanded_words)
 
-    def _find_best_pattern_match(self, normalized_title: str, patterns_dict: dict[str, list[str]]) -> Optional[dict]:
-        best_match = None
-        best_score = 0.0
-
-        for role_type, patterns in patterns_dict.items():
-            for pattern in patterns:
-                score = self._calculate_pattern_match_score(normalized_title, pattern)
-                if score > best_score:
-                    best_score = score
-                    best_match = {
-                        "role_type": role_type,
-                        "confidence": score,
-                        "keywords": pattern.split(),
-                        "pattern": pattern,
-                    }
-
-        return best_match if best_score > 0.3 else None
-
-    def _calculate_pattern_match_score(self, title: str, pattern: str) -> float:
-        title_words = set(title.split())
-        pattern_words = set(pattern.split())
+    def _candidate_patterns(self, normalized_title: str) -> set[str]:
+        """Patterns that can score above zero against the title."""
+        candidates = self._find_contained_patterns(normalized_title)
+        for word in normalized_title.split():
+            candidates.update(self._patterns_by_word.get(word, ()))
+        return candidates
+
+    def _find_best_pattern_match(self, normalized_title: str, candidates: set[str]) -> Optional[dict]:
+        """Best-scoring candidate pattern above the match threshold.
+
+        Each candidate is scored once; ties go to the pattern checked first, matching a
+        table-by-table scan in ``_seniority_tables`` order.
+        """
+        best_position = None
+        best_entry = None
+        best_score = 0.3
+        title_words = frozenset(normalized_title.split())
+
+        for pattern in candidates:
+            score = self._calculate_pattern_match_score(normalized_title, pattern, title_words)
+            if score < best_score:
+                continue
+            position, role_type, seniority = self._pattern_first_match[pattern]
+            if score > best_score or (best_position is not None and position < best_position):
+                best_position = position
+                best_entry = (pattern, role_type, seniority)
+                best_score = score
+
+        if best_entry is None:
+            return None
+
+        pattern, role_type, seniority = best_entry
+        return {
+            "seniority": seniority,
+            "category": self._determine_category(role_type, seniority),
+            "confidence": best_score,
+            "keywords": pattern.split(),
+        }
 
+    def _calculate_pattern_match_score(
+        self, title: str, pattern: str, title_words: Optional[frozenset[str]] = None
+    ) -> float:
         if pattern == title:
             return 1.0
         if pattern in title:
             return 0.9
 
+        pattern_words = self._pattern_words.get(pattern)
+        if pattern_words is None:
+            pattern_words = frozenset(pattern.split())
         if not pattern_words:
             return 0.0
+        if title_words is None:
+            title_words = frozenset(title.split())
 
-        intersection = title_words.intersection(pattern_words)
+        intersection = title_words & pattern_words
+        if not intersection:
+            return 0.0
         overlap_ratio = len(intersection) / len(pattern_words)
 
-        key_words = {"manager", "director", "president", "ceo", "owner", "vice", "chief"}
-        key_word_bonus = sum(0.1 for word in intersection if word in key_words)
+        key_word_bonus = 0.1 * len(intersection & _KEY_WORDS)
 
         base_score = overlap_ratio + key_word_bonus
         penalty = len(title_words - pattern_words) * 0.05
@@ -372,39 +477,10 @@ class RoleClassifier:
     def _is_dealership_company(self, company_name: str) -> bool:
         if not company_name:
             return False
-        dealership_indicators = {
-            "auto",
-            "automotive",
-            "car",
-            "cars",
-            "dealership",
-            "dealer",
-            "motors",
-            "honda",
-            "toyota",
-            "ford",
-            "chevrolet",
-            "bmw",
-            "mercedes",
-            "audi",
-            "nissan",
-            "volkswagen",
-            "hyundai",
-            "kia",
-            "mazda",
-            "subaru",
-            "lexus",
-            "acura",
-            "infiniti",
-            "cadillac",
-            "buick",
-            "gmc",
-        }
-        company_lower = company_name.lower()
-        return any(indicator in company_lower for indicator in dealership_indicators)
+        return bool(_find_dealership_indicators(company_name.lower()))
 
     def _has_negative_patterns(self, normalized_title: str) -> bool:
-        return any(pattern in normalized_title for pattern in self.negative_patterns)
+        return bool(self._find_negative_patterns(normalized_title))
 
     def _create_other_classification(self, title: str, confidence: float) -> RoleClassification:
         return RoleClassification(
@@ -545,3 +621,8 @@ class RoleClassifier:
             stats["avg_seniority_score"] = 0.0
 
         return stats
+
+
+# Shared instance for callers that don't customize patterns, so the pattern tables are built
+# once per process; treat it as read-only
+DEFAULT_CLASSIFIER = RoleClassifier()
@@ -2,16 +2,119 @@
 
 import logging
 import re
+import string
 from dataclasses import dataclass, field
-from typing import Optional
+from functools import lru_cache
+from itertools import chain, repeat
+from operator import attrgetter
+from typing import Iterable, Optional, Sequence
+
+import numpy as np
+import pandas as pd
 
 from .email_verification import EmailVerificationService, VerificationResult
-from .role_classifier import RoleClassifier
+from .role_classifier import DEFAULT_CLASSIFIER, RoleClassification, RoleClassifier
+
+try:
+    import re2 as _re2
+except ImportError:
+    _re2 = re
 
 logger = logging.getLogger(__name__)
 
+# Profile and company pages in one linear-time pattern: RE2 when installed, otherwise
+# a possessive slug quantifier so re rejects malformed URLs without backtracking
+_LINKEDIN_RE = (
+    _re2.compile(r"^https?://(?:www\.)?linkedin\.com/(?:in|company)/[a-zA-Z0-9\-_%]+/?$")
+    if _re2 is not re
+    else re.compile(r"^https?://(?:www\.)?linkedin\.com/(?:in|company)/[a-zA-Z0-9\-_%]++/?$")
+)
+_NON_DIGIT_RE = re.compile(r"\D")
+# One unexpected character is enough, so no quantifier to extend the match
+_NAME_BAD_CHARS_RE = re.compile(r"[^a-zA-Z\s\-'.]")
+_PLACEHOLDER_PHONE_PREFIXES = ("0" * 10, "1" * 10, "123456")
+
+# Professional-title points by seniority and dealership-relevance bonus by category
+_SENIORITY_TITLE_POINTS = {
+    "C-Suite": 20.0,
+    "Senior Executive": 18.0,
+    "Director": 16.0,
+    "Manager": 14.0,
+    "Specialist": 10.0,
+    "Coordinator": 6.0,
+    "Other": 4.0,
+}
+_CATEGORY_TITLE_BONUS = {
+    "Ownership": 5.0,
+    "Senior Leadership": 4.0,
+    "Management": 3.0,
+    "Department Head": 3.0,
+    "Sales": 2.0,
+    "Service": 2.0,
+    "Finance": 2.0,
+    "Marketing": 1.0,
+    "Operations": 1.0,
+    "IT/Technology": 0.5,
+    "HR/Admin": 0.5,
+    "Specialist": 1.0,
+    "Other": 0.0,
+}
+_FIELD_RESULTS = attrgetter("email", "phone", "name", "linkedin", "title")
+_COMPLETENESS_FIELDS = ("email", "phone", "name", "title", "linkedin_url")
+
+# Deletes every ASCII non-digit; phone strings are almost always pure ASCII
+_ASCII_NON_DIGIT_DELETE = str.maketrans("", "", "".join(chr(i) for i in range(128) if not chr(i).isdigit()))
+
+# Translation tables that delete every allowed character, so any leftover means a bad char
+_EMAIL_LOCAL_DELETE = str.maketrans("", "", string.ascii_letters + string.digits + ".!#$%&'*+/=?^_`{|}~-")
+_DOMAIN_LABEL_DELETE = str.maketrans("", "", string.ascii_letters + string.digits + "-")
+
+
+def _fast_email_check(email: str) -> bool:
+    """Check email format without a backtracking regex.
+
+    Accepts exactly what the RFC-style pattern ``local@label(.label)*`` did: an
+    ASCII local part of allowed characters, and domain labels of 1-63
+    alphanumerics or hyphens that neither start nor end with a hyphen.
+    """
+    local, sep, domain = email.partition("@")
+    if not sep or not local or not domain or "@" in domain:
+        return False
+    if local.translate(_EMAIL_LOCAL_DELETE):
+        return False
+    for label in domain.split("."):
+        if not label or len(label) > 63 or label[0] == "-" or label[-1] == "-":
+            return False
+        if label.translate(_DOMAIN_LABEL_DELETE):
+            return False
+    return True
+
+
+def _digits_only(value: str) -> str:
+    """Strip everything but decimal digits from a string in a single C-level pass."""
+    digits = value.translate(_ASCII_NON_DIGIT_DELETE)
+    if digits.isascii():
+        return digits
+    # Non-ASCII leftovers may include Unicode digits, which \d also keeps
+    return _NON_DIGIT_RE.sub("", digits)
+
+
+def _split_phone_number(phone: str) -> tuple[str, str]:
+    """Return (digits, normalized) for a phone number, stripping formatting only once."""
+    digits = _digits_only(phone)
+
+    # Handle US numbers
+    if len(digits) == 11 and digits[0] == "1":
+        digits = digits[1:]
 
-@dataclass
+    if len(digits) == 10:
+        return digits, f"({digits[:3]}) {digits[3:6]}-{digits[6:]}"
+
+    # Return cleaned digits for non-US numbers
+    return digits, digits
+
+
+@dataclass(slots=True)
 class ValidationResult:
     is_valid: bool
     issues: list[str] = field(default_factory=list)
@@ -19,7 +122,7 @@ class ValidationResult:
     verification_result: Optional[VerificationResult] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class ContactValidation:
     email: ValidationResult
     phone: ValidationResult
@@ -29,7 +132,7 @@ class ContactValidation:
     overall_issues: list[str] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True)
 class ConfidenceFactors:
     data_completeness: float = 0.0
     domain_consistency: float = 0.0
@@ -39,84 +142,150 @@ class ConfidenceFactors:
     email_quality: float = 0.0
 
 
+# Packed factors: one uint8 column per ConfidenceFactors field, in tenths of a point.
+# No factor exceeds 25 points, so 250 is the largest stored value.
+CONFIDENCE_FACTOR_FIELDS = (
+    "data_completeness",
+    "domain_consistency",
+    "professional_title",
+    "linkedin_presence",
+    "data_consistency",
+    "email_quality",
+)
+CONFIDENCE_FACTOR_SCALE = 10
+_FACTOR_VALUES = attrgetter(*CONFIDENCE_FACTOR_FIELDS)
+
+
+def pack_confidence_factors(factors: Sequence[ConfidenceFactors]) -> np.ndarray:
+    """Quantize ConfidenceFactors into an ``(N, 6)`` uint8 array of tenths of a point."""
+    values = np.array([_FACTOR_VALUES(f) for f in factors], dtype=float).reshape(-1, len(CONFIDENCE_FACTOR_FIELDS))
+    return _quantize_factors(values)
+
+
+def unpack_confidence_factors(packed: np.ndarray) -> list[ConfidenceFactors]:
+    """Expand a packed factor array back into ConfidenceFactors (to 0.1 point precision)."""
+    return [ConfidenceFactors(*row) for row in (packed / CONFIDENCE_FACTOR_SCALE).tolist()]
+
+
+def _quantize_factors(values: np.ndarray) -> np.ndarray:
+    return np.clip(np.rint(values * CONFIDENCE_FACTOR_SCALE), 0, 255).astype(np.uint8)
+
+
 class ContactValidator:
     """Validates and scores dealership contact data quality."""
 
-    SENIOR_TITLES = {
-        "owner",
-        "co-owner",
-        "president",
-        "ceo",
-        "chief executive officer",
-        "cfo",
-        "chief financial officer",
-        "coo",
-        "chief operating officer",
-        "general manager",
-        "managing partner",
-        "principal",
-        "dealer principal",
-        "executive director",
-        "managing director",
-        "vice president",
-        "vp",
-        "svp",
-        "evp",
-    }
-
-    MANAGEMENT_TITLES = {
-        "director",
-        "manager",
-        "sales manager",
-        "service manager",
-        "finance manager",
-        "parts manager",
-        "marketing manager",
-        "operations manager",
-        "general sales manager",
-        "f&i manager",
-        "business manager",
-        "fixed operations manager",
-        "internet sales manager",
-        "fleet manager",
-    }
-
-    DISPOSABLE_EMAIL_DOMAINS = {
-        "mailinator.com",
-        "guerrillamail.com",
-        "tempmail.com",
-        "throwaway.email",
-        "yopmail.com",
-        "sharklasers.com",
-        "guerrillamailblock.com",
-        "grr.la",
-        "dispostable.com",
-        "trashmail.com",
-        "10minutemail.com",
-        "temp-mail.org",
-        "fakeinbox.com",
-        "mailnesia.com",
-        "maildrop.cc",
-    }
-
-    PERSONAL_EMAIL_DOMAINS = {
-        "gmail.com",
-        "yahoo.com",
-        "hotmail.com",
-        "outlook.com",
-        "aol.com",
-        "icloud.com",
-        "mail.com",
-        "protonmail.com",
-        "zoho.com",
-        "yandex.com",
-        "live.com",
-        "msn.com",
-        "comcast.net",
-        "att.net",
-        "verizon.net",
-        "cox.net",
-    }
+    SENIOR_TITLES = frozenset(
+        {
+            "owner",
+            "co-owner",
+            "president",
+            "ceo",
+            "chief executive officer",
+            "cfo",
+            "chief financial officer",
+            "coo",
+            "chief operating officer",
+            "general manager",
+            "managing partner",
+            "principal",
+            "dealer principal",
+            "executive director",
+            "managing director",
+            "vice president",
+            "vp",
+            "svp",
+            "evp",
+        }
+    )
+
+    MANAGEMENT_TITLES = frozenset(
+        {
+            "director",
+            "manager",
+            "sales manager",
+            "service manager",
+            "finance manager",
+            "parts manager",
+            "marketing manager",
+            "operations manager",
+            "general sales manager",
+            "f&i manager",
+            "business manager",
+            "fixed operations manager",
+            "internet sales manager",
+            "fleet manager",
+        }
+    )
+
+    DISPOSABLE_EMAIL_DOMAINS = frozenset(
+        {
+            "mailinator.com",
+            "guerrillamail.com",
+            "tempmail.com",
+            "throwaway.email",
+            "yopmail.com",
+            "sharklasers.com",
+            "guerrillamailblock.com",
+            "grr.la",
+            "dispostable.com",
+            "trashmail.com",
+            "10minutemail.com",
+            "temp-mail.org",
+            "fakeinbox.com",
+            "mailnesia.com",
+            "maildrop.cc",
+        }
+    )
+
+    PERSONAL_EMAIL_DOMAINS = frozenset(
+        {
+            "gmail.com",
+            "yahoo.com",
+            "hotmail.com",
+            "outlook.com",
+            "aol.com",
+            "icloud.com",
+            "mail.com",
+            "protonmail.com",
+            "zoho.com",
+            "yandex.com",
+            "live.com",
+            "msn.com",
+            "comcast.net",
+            "att.net",
+            "verizon.net",
+            "cox.net",
+        }
+    )
+
+    PLACEHOLDER_NAMES = frozenset(
+        {
+            "test",
+            "unknown",
+            "n/a",
+            "na",
+            "none",
+            "null",
+            "admin",
+            "user",
+            "contact",
+            "info",
+            "support",
+        }
+    )
+
+    PLACEHOLDER_TITLES = frozenset(
+        {
+            "test",
+            "unknown",
+            "n/a",
+            "na",
+            "none",
+            "null",
+            "employee",
+            "staff",
+        }
+    )
 
     def __init__(
         self,
@@ -124,7 +293,24 @@ class ContactValidator:
         role_classifier: Optional[RoleClassifier] = None,
     ):
         self.email_service = email_verification_service
-        self.role_classifier = role_classifier or RoleClassifier()
+        # Dealership titles repeat heavily across contacts, so memoize per instance
+        self._classify_cached = lru_cache(maxsize=4096)(self._classify_role)
+        # Emails and phones recur across bulk loads; cache the I/O-free checks
+        self._check_email_cached = lru_cache(maxsize=8192)(self._check_email)
+        self._check_phone_cached = lru_cache(maxsize=8192)(self._check_phone)
+        self.role_classifier = role_classifier or DEFAULT_CLASSIFIER
+
+    @property
+    def role_classifier(self) -> RoleClassifier:
+        return self._role_classifier
+
+    @role_classifier.setter
+    def role_classifier(self, role_classifier: RoleClassifier) -> None:
+        self._role_classifier = role_classifier
+        self._classify_cached.cache_clear()
+
+    def _classify_role(self, title: str, company_name: str) -> RoleClassification:
+        return self._role_classifier.classify_role(title, company_name)
 
     def validate_contact(self, contact: dict) -> ContactValidation:
         """Run full validation on a contact record."""
@@ -149,12 +335,10 @@ class ContactValidator:
         email = contact.get("email", "")
         name = contact.get("name", "")
         if email and name and "@" in email:
-            domain = email.rsplit("@", 1)[1].lower()
+            local_part, _, domain = email.lower().rpartition("@")
             if domain not in self.PERSONAL_EMAIL_DOMAINS:
-                local_part = email.rsplit("@", 1)[0].lower()
-                name_parts = name.lower().split()
-                name_in_email = any(part in local_part for part in name_parts if len(part) > 2)
-                if not name_in_email:
+                name_parts = [part for part in name.lower().split() if len(part) > 2]
+                if not any(part in local_part for part in name_parts):
                     overall_issues.append("Email local part does not appear to match contact name")
 
         validation = ContactValidation(
@@ -180,29 +364,16 @@ class ContactValidator:
             return ValidationResult(is_valid=False, issues=["Missing email address"])
 
         email = email.strip().lower()
-        issues: list[str] = []
 
-        # Basic format check
-        email_regex = re.compile(
-            r"^[a-zA-Z0-9.!#$%&'*+/=?^_`{|}~-]+@"
-            r"[a-zA-Z0-9](?:[a-zA-Z0-9-]{0,61}[a-zA-Z0-9])?"
-            r"(?:\.[a-zA-Z0-9](?:[a-zA-Z0-9-]{0,61}[a-zA-Z0-9])?)*$"
-        )
-        if not email_regex.match(email):
+        # Format and domain checks are pure, so repeated addresses hit the cache
+        format_ok, domain_issues = self._check_email_cached(email)
+        if not format_ok:
             return ValidationResult(
                 is_valid=False,
                 issues=["Invalid email format"],
                 normalized_value=email,
             )
-
-        # Domain checks
-        domain = email.rsplit("@", 1)[1]
-
-        if domain in self.DISPOSABLE_EMAIL_DOMAINS:
-            issues.append("Disposable email domain")
-
-        if domain in self.PERSONAL_EMAIL_DOMAINS:
-            issues.append("Personal email domain (not company email)")
+        issues = list(domain_issues)
 
         # Verify via email verification service if available
         verification_result = None
@@ -226,26 +397,47 @@ class ContactValidator:
             verification_result=verification_result,
         )
 
+    def _check_email(self, email: str) -> tuple[bool, tuple[str, ...]]:
+        """Return (format_ok, domain_issues) for a stripped, lowercased email."""
+        if not _fast_email_check(email):
+            return False, ()
+
+        issues: list[str] = []
+        domain = email.rpartition("@")[2]
+
+        if domain in self.DISPOSABLE_EMAIL_DOMAINS:
+            issues.append("Disposable email domain")
+
+        if domain in self.PERSONAL_EMAIL_DOMAINS:
+            issues.append("Personal email domain (not company email)")
+
+        return True, tuple(issues)
+
     def validate_phone(self, phone: str) -> ValidationResult:
         """Validate and normalize a phone number."""
         if not phone or not isinstance(phone, str):
             return ValidationResult(is_valid=False, issues=["Missing phone number"])
 
-        phone = phone.strip()
+        is_valid, issues, normalized = self._check_phone_cached(phone.strip())
+
+        return ValidationResult(
+            is_valid=is_valid,
+            issues=list(issues),
+            normalized_value=normalized,
+        )
+
+    def _check_phone(self, phone: str) -> tuple[bool, tuple[str, ...], str]:
+        """Return (is_valid, issues, normalized_value) for a stripped phone string."""
         issues: list[str] = []
 
-        # Strip common formatting characters
-        normalized = self._normalize_phone_number(phone)
+        # Strip common formatting characters; the digits are reused for the checks below
+        digits_only, normalized = _split_phone_number(phone)
 
         if not normalized:
-            return ValidationResult(
-                is_valid=False,
-                issues=["Phone number contains no digits"],
-                normalized_value=phone,
-            )
+            return False, ("Phone number contains no digits",), phone
 
         # Check length (US numbers: 10 digits, with country code: 11)
-        digit_count = len(re.sub(r"\D", "", normalized))
+        digit_count = len(digits_only)
 
         if digit_count < 10:
             issues.append(f"Phone number too short ({digit_count} digits)")
@@ -253,20 +445,13 @@ class ContactValidator:
             issues.append(f"Phone number too long ({digit_count} digits)")
 
         # Check for obviously fake numbers
-        digits_only = re.sub(r"\D", "", normalized)
-        if digits_only and len(set(digits_only)) == 1:
+        if digits_only and digits_only == digits_only[0] * digit_count:
             issues.append("Phone number appears to be fake (all same digit)")
 
-        if re.match(r"^(0{10}|1{10}|123456)", digits_only):
+        if digits_only.startswith(_PLACEHOLDER_PHONE_PREFIXES):
             issues.append("Phone number appears to be a placeholder")
 
-        is_valid = len(issues) == 0
-
-        return ValidationResult(
-            is_valid=is_valid,
-            issues=issues,
-            normalized_value=normalized,
-        )
+        return not issues, tuple(issues), normalized
 
     def validate_name(self, name: str) -> ValidationResult:
         """Validate a contact name."""
@@ -281,20 +466,7 @@ class ContactValidator:
             issues.append("Name is too short")
 
         # Check for placeholder names
-        placeholder_names = {
-            "test",
-            "unknown",
-            "n/a",
-            "na",
-            "none",
-            "null",
-            "admin",
-            "user",
-            "contact",
-            "info",
-            "support",
-        }
-        if name.lower() in placeholder_names:
+        if name.lower() in self.PLACEHOLDER_NAMES:
             issues.append("Name appears to be a placeholder")
 
         # Check for at least two words (first + last)
@@ -303,7 +475,7 @@ class ContactValidator:
             issues.append("Name appears to be missing first or last name")
 
         # Check for non-letter characters (allow hyphens, apostrophes, spaces, periods)
-        if re.search(r"[^a-zA-Z\s\-'.]+", name):
+        if _NAME_BAD_CHARS_RE.search(name):
             issues.append("Name contains unexpected characters")
 
         # Check for excessive length
@@ -330,10 +502,7 @@ class ContactValidator:
         issues: list[str] = []
 
         # Check for LinkedIn URL pattern
-        linkedin_pattern = re.compile(r"^https?://(www\.)?linkedin\.com/in/[a-zA-Z0-9\-_%]+/?$")
-        company_pattern = re.compile(r"^https?://(www\.)?linkedin\.com/company/[a-zA-Z0-9\-_%]+/?$")
-
-        if not linkedin_pattern.match(url) and not company_pattern.match(url):
+        if not _LINKEDIN_RE.match(url):
             # Try to normalize common issues
             if "linkedin.com" in url.lower():
                 issues.append("LinkedIn URL format is non-standard")
@@ -367,17 +536,7 @@ class ContactValidator:
             issues.append("Job title is too short")
 
         # Check for placeholder titles
-        placeholder_titles = {
-            "test",
-            "unknown",
-            "n/a",
-            "na",
-            "none",
-            "null",
-            "employee",
-            "staff",
-        }
-        if title.lower() in placeholder_titles:
+        if title.lower() in self.PLACEHOLDER_TITLES:
             issues.append("Job title appears to be a placeholder")
 
         # Check for excessive length
@@ -403,16 +562,15 @@ class ContactValidator:
         total_score = 0.0
 
         # 1. Data completeness (0-25 points)
-        completeness_fields = ["email", "phone", "name", "title", "linkedin_url"]
-        filled_count = sum(1 for f in completeness_fields if contact.get(f) and str(contact[f]).strip())
-        factors.data_completeness = (filled_count / len(completeness_fields)) * 25
+        filled_count = sum(1 for f in _COMPLETENESS_FIELDS if contact.get(f) and str(contact[f]).strip())
+        factors.data_completeness = (filled_count / len(_COMPLETENESS_FIELDS)) * 25
         total_score += factors.data_completeness
 
         # 2. Domain consistency (0-15 points)
         email = contact.get("email", "")
-        company_domain = contact.get("company_domain", "")
         if email and "@" in email:
-            email_domain = email.rsplit("@", 1)[1].lower()
+            email_domain = email.rpartition("@")[2].lower()
+            company_domain = contact.get("company_domain", "")
             if company_domain and email_domain == company_domain.lower():
                 factors.domain_consistency = 15.0
             elif email_domain not in self.PERSONAL_EMAIL_DOMAINS:
@@ -424,39 +582,12 @@ class ContactValidator:
         # 3. Professional title (0-20 points) with role classification
         title = contact.get("title", "")
         if title:
-            # Use role classifier for enhanced scoring
-            role_classification = self.role_classifier.classify_role(title, contact.get("company_name", ""))
-
-            seniority_mapping = {
-                "C-Suite": 20.0,
-                "Senior Executive": 18.0,
-                "Director": 16.0,
-                "Manager": 14.0,
-                "Specialist": 10.0,
-                "Coordinator": 6.0,
-                "Other": 4.0,
-            }
+            role_classification = self._classify_contact_title(contact)
 
-            base_title_score = seniority_mapping.get(role_classification.seniority.value, 4.0)
+            base_title_score = _SENIORITY_TITLE_POINTS.get(role_classification.seniority.value, 4.0)
 
             # Category bonus for dealership-relevant roles
-            category_bonus = {
-                "Ownership": 5.0,
-                "Senior Leadership": 4.0,
-                "Management": 3.0,
-                "Department Head": 3.0,
-                "Sales": 2.0,
-                "Service": 2.0,
-                "Finance": 2.0,
-                "Marketing": 1.0,
-                "Operations": 1.0,
-                "IT/Technology": 0.5,
-                "HR/Admin": 0.5,
-                "Specialist": 1.0,
-                "Other": 0.0,
-            }
-
-            bonus = category_bonus.get(role_classification.category.value, 0.0)
+            bonus = _CATEGORY_TITLE_BONUS.get(role_classification.category.value, 0.0)
             factors.professional_title = min(20.0, base_title_score + bonus)
 
             # Dealership-specific boost
@@ -518,6 +649,131 @@ class ContactValidator:
 
         return round(final_score, 1), factors
 
+    def calculate_confidence_batch(
+        self, contacts: list[dict], validations: Optional[list[ContactValidation]] = None
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """Score many contacts at once; equivalent to calculate_confidence_score per contact.
+
+        Per-contact inputs are gathered into flat arrays (one per scoring factor)
+        and combined with elementwise array operations, instead of building a
+        ConfidenceFactors for every contact. Returns the ``(N,)`` scores and the
+        ``(N, 6)`` float factor array in CONFIDENCE_FACTOR_FIELDS order.
+        """
+        factors = self._confidence_factor_matrix(contacts, validations)
+        total_score = factors.sum(axis=1)
+
+        # Max possible is 110, scale to 100
+        return np.round(np.minimum(100.0, (total_score / 110.0) * 100.0), 1), factors
+
+    def calculate_confidence_scores_batch(
+        self, contacts: list[dict], validations: Optional[list[ContactValidation]] = None
+    ) -> np.ndarray:
+        """Score many contacts at once, returning only the ``(N,)`` scores."""
+        return self.calculate_confidence_batch(contacts, validations)[0]
+
+    def calculate_confidence_factors_packed(
+        self, contacts: list[dict], validations: Optional[list[ContactValidation]] = None
+    ) -> np.ndarray:
+        """Score many contacts into a packed ``(N, 6)`` uint8 factor array.
+
+        Columns follow CONFIDENCE_FACTOR_FIELDS in tenths of a point; use
+        unpack_confidence_factors to get ConfidenceFactors back.
+        """
+        return _quantize_factors(self._confidence_factor_matrix(contacts, validations))
+
+    def _confidence_factor_matrix(
+        self, contacts: list[dict], validations: Optional[list[ContactValidation]]
+    ) -> np.ndarray:
+        """Return an ``(N, 6)`` float array of scoring factors in CONFIDENCE_FACTOR_FIELDS order."""
+        if validations is None:
+            validations = [self.validate_contact(contact) for contact in contacts]
+
+        count = len(contacts)
+        filled = np.zeros(count)
+        domain_points = np.zeros(count)
+        has_title = np.zeros(count, dtype=bool)
+        title_points = np.zeros(count)
+        title_bonus = np.zeros(count)
+        dealership_specific = np.zeros(count, dtype=bool)
+        linkedin_points = np.zeros(count)
+        issue_count = np.zeros(count)
+        email_valid = np.zeros(count, dtype=bool)
+        has_email = np.zeros(count, dtype=bool)
+        email_points = np.full(count, 15.0)
+        email_confidence = np.ones(count)
+        company_domains_lower: dict[str, str] = {}
+
+        for i, (contact, validation) in enumerate(zip(contacts, validations)):
+            filled[i] = sum(1 for f in _COMPLETENESS_FIELDS if contact.get(f) and str(contact[f]).strip())
+
+            email = contact.get("email", "")
+            has_email[i] = bool(email)
+            if email and "@" in email:
+                email_domain = email.rpartition("@")[2].lower()
+                company_domain = contact.get("company_domain", "")
+                if company_domain:
+                    # Contacts in a batch usually share a handful of company domains
+                    company_domain_lower = company_domains_lower.get(company_domain)
+                    if company_domain_lower is None:
+                        company_domain_lower = company_domains_lower[company_domain] = company_domain.lower()
+                else:
+                    company_domain_lower = ""
+                if company_domain_lower and email_domain == company_domain_lower:
+                    domain_points[i] = 15.0
+                elif email_domain not in self.PERSONAL_EMAIL_DOMAINS:
+                    domain_points[i] = 10.0
+                else:
+                    domain_points[i] = 3.0
+
+            if contact.get("title", ""):
+                role_classification = self._classify_contact_title(contact)
+                has_title[i] = True
+                title_points[i] = _SENIORITY_TITLE_POINTS.get(role_classification.seniority.value, 4.0)
+                title_bonus[i] = _CATEGORY_TITLE_BONUS.get(role_classification.category.value, 0.0)
+                dealership_specific[i] = role_classification.dealership_specific
+
+            if contact.get("linkedin_url", ""):
+                linkedin_points[i] = 15.0 if validation.linkedin.is_valid else 5.0
+
+            issue_count[i] = len(validation.overall_issues) * 3.0 + (
+                len(validation.email.issues)
+                + len(validation.phone.issues)
+                + len(validation.name.issues)
+                + len(validation.title.issues)
+                + len(validation.linkedin.issues)
+            )
+
+            email_valid[i] = validation.email.is_valid
+            vr = validation.email.verification_result
+            if vr:
+                if vr.verification_level == "mailbox":
+                    email_points[i] = 20.0
+                elif vr.verification_level == "domain":
+                    email_points[i] = 17.0
+                email_confidence[i] = vr.confidence
+
+        data_completeness = (filled / len(_COMPLETENESS_FIELDS)) * 25
+        professional_title = np.minimum(20.0, title_points + title_bonus)
+        professional_title = np.where(
+            dealership_specific, np.minimum(20.0, professional_title + 2.0), professional_title
+        )
+        professional_title = np.where(has_title, professional_title, 0.0)
+        data_consistency = np.maximum(0.0, 15.0 - issue_count)
+        email_quality = np.where(email_valid, email_points * email_confidence, np.where(has_email, 2.0, 0.0))
+
+        return np.column_stack(
+            (data_completeness, domain_points, professional_title, linkedin_points, data_consistency, email_quality)
+        )
+
+    def _classify_contact_title(self, contact: dict) -> RoleClassification:
+        # Classification is case-insensitive, so case variants share one cache entry
+        title = contact.get("title", "")
+        company_name = contact.get("company_name", "")
+        return self._classify_cached(
+            title.strip().lower() if isinstance(title, str) else title,
+            company_name.strip().lower() if isinstance(company_name, str) else company_name,
+        )
+
     def get_quality_flags(self, contact: dict, validation: Optional[ContactValidation] = None) -> list[str]:
         """Generate quality flag labels for a contact."""
         if validation is None:
@@ -526,16 +782,16 @@ class ContactValidator:
         flags: list[str] = []
 
         # Positive flags
-        title = contact.get("title", "").lower().strip()
-        if title in self.SENIOR_TITLES:
+        title_lower = (contact.get("title") or "").lower().strip()
+        if title_lower in self.SENIOR_TITLES:
             flags.append("senior_leader")
-        elif title in self.MANAGEMENT_TITLES:
+        elif title_lower in self.MANAGEMENT_TITLES:
             flags.append("management")
 
         if validation.email.is_valid:
             email = contact.get("email", "")
             if "@" in email:
-                domain = email.rsplit("@", 1)[1].lower()
+                domain = email.rpartition("@")[2].lower()
                 if domain not in self.PERSONAL_EMAIL_DOMAINS:
                     flags.append("company_email")
                 else:
@@ -564,24 +820,7 @@ class ContactValidator:
 
     def _normalize_phone_number(self, phone: str) -> str:
         """Normalize a phone number to a consistent format."""
-        # Remove common formatting
-        cleaned = re.sub(r"[\s\-\(\)\.\+]", "", phone)
-
-        # Remove non-digit characters
-        digits = re.sub(r"\D", "", cleaned)
-
-        if not digits:
-            return ""
-
-        # Handle US numbers
-        if len(digits) == 11 and digits.startswith("1"):
-            digits = digits[1:]
-
-        if len(digits) == 10:
-            return f"({digits[:3]}) {digits[3:6]}-{digits[6:]}"
-
-        # Return cleaned digits for non-US numbers
-        return digits
+        return _split_phone_number(phone)[1]
 
 
 class ValidationSummary:
@@ -593,8 +832,60 @@ class ValidationSummary:
         validations: list[ContactValidation],
         scores: Optional[list[tuple[float, ConfidenceFactors]]] = None,
     ) -> dict:
-        """Generate a summary of validation results for a batch of contacts."""
+        """Generate a summary of validation results for a batch of contacts.
+
+        Totals follow contacts/validations, which must have the same length; scores
+        may cover only the first contacts, the rest counting as unscored.
+        """
         if not contacts or not validations:
+            return ValidationSummary.generate_summary_streaming(())
+        if len(validations) != len(contacts):
+            raise ValueError(f"Got {len(validations)} validations for {len(contacts)} contacts")
+        if scores and len(scores) > len(contacts):
+            raise ValueError(f"Got {len(scores)} scores for {len(contacts)} contacts")
+        return ValidationSummary.generate_summary_streaming(
+            zip(contacts, validations, chain(scores or (), repeat(None)))
+        )
+
+    @staticmethod
+    def generate_summary_streaming(
+        rows: Iterable[tuple[dict, ContactValidation, Optional[tuple[float, ConfidenceFactors]]]],
+    ) -> dict:
+        """Generate a validation summary in one pass over (contact, validation, score) rows.
+
+        Only counters are kept, so rows can come straight from a generator (e.g. a
+        database cursor) without materializing the whole batch. The score element
+        may be None for rows that were not scored.
+        """
+        total = 0
+        # Single pass for contact-method, field validity, issue counts and score buckets
+        valid_count = email_ok = phone_ok = name_ok = linkedin_ok = title_ok = 0
+        issue_counts: dict[str, int] = {}
+        get_issue_count = issue_counts.get
+        score_count = 0
+        score_total = 0.0
+        # Buckets of 20 points: 0-1 poor, 2 fair, 3 good, 4-5 excellent
+        score_buckets = [0] * 6
+        for _contact, v, score in rows:
+            total += 1
+            email, phone, name, linkedin, title = _FIELD_RESULTS(v)
+            # bool adds as 0/1, so no per-field branching is needed
+            email_ok += email.is_valid
+            phone_ok += phone.is_valid
+            valid_count += email.is_valid or phone.is_valid
+            name_ok += name.is_valid
+            linkedin_ok += linkedin.is_valid
+            title_ok += title.is_valid
+            for issues in (email.issues, phone.issues, name.issues, linkedin.issues, title.issues, v.overall_issues):
+                for issue in issues:
+                    issue_counts[issue] = get_issue_count(issue, 0) + 1
+            if score is not None:
+                score_val = score[0]
+                score_count += 1
+                score_total += score_val
+                score_buckets[min(5, max(0, int(score_val // 20)))] += 1
+
+        if not total:
             return {
                 "total_contacts": 0,
                 "valid_contacts": 0,
@@ -606,63 +897,150 @@ class ValidationSummary:
                 "quality_distribution": {},
             }
 
-        total = len(contacts)
-
-        # Count valid contacts (has at least one valid contact method)
-        valid_count = sum(1 for v in validations if v.email.is_valid or v.phone.is_valid)
-        invalid_count = total - valid_count
-
         # Field validity rates
         field_validity = {
-            "email": sum(1 for v in validations if v.email.is_valid) / total * 100,
-            "phone": sum(1 for v in validations if v.phone.is_valid) / total * 100,
-            "name": sum(1 for v in validations if v.name.is_valid) / total * 100,
-            "linkedin": sum(1 for v in validations if v.linkedin.is_valid) / total * 100,
-            "title": sum(1 for v in validations if v.title.is_valid) / total * 100,
+            "email": round(email_ok / total * 100, 1),
+            "phone": round(phone_ok / total * 100, 1),
+            "name": round(name_ok / total * 100, 1),
+            "linkedin": round(linkedin_ok / total * 100, 1),
+            "title": round(title_ok / total * 100, 1),
         }
-        field_validity = {k: round(v, 1) for k, v in field_validity.items()}
-
-        # Common issues
-        issue_counts: dict[str, int] = {}
-        for v in validations:
-            all_issues = (
-                v.email.issues + v.phone.issues + v.name.issues + v.linkedin.issues + v.title.issues + v.overall_issues
-            )
-            for issue in all_issues:
-                issue_counts[issue] = issue_counts.get(issue, 0) + 1
 
         common_issues = dict(sorted(issue_counts.items(), key=lambda x: x[1], reverse=True)[:10])
 
         # Confidence score distribution
-        avg_confidence = 0.0
         quality_distribution = {
-            "excellent": 0,  # 80-100
-            "good": 0,  # 60-79
-            "fair": 0,  # 40-59
-            "poor": 0,  # 0-39
+            "excellent": score_buckets[4] + score_buckets[5],  # 80-100
+            "good": score_buckets[3],  # 60-79
+            "fair": score_buckets[2],  # 40-59
+            "poor": score_buckets[0] + score_buckets[1],  # 0-39
         }
-
-        if scores:
-            score_values = [s[0] for s in scores]
-            avg_confidence = round(sum(score_values) / len(score_values), 1)
-
-            for score_val in score_values:
-                if score_val >= 80:
-                    quality_distribution["excellent"] += 1
-                elif score_val >= 60:
-                    quality_distribution["good"] += 1
-                elif score_val >= 40:
-                    quality_distribution["fair"] += 1
-                else:
-                    quality_distribution["poor"] += 1
+        avg_confidence = round(score_total / score_count, 1) if score_count else 0.0
 
         return {
             "total_contacts": total,
             "valid_contacts": valid_count,
-            "invalid_contacts": invalid_count,
+            "invalid_contacts": total - valid_count,
             "validation_rate": round((valid_count / total) * 100, 1),
             "avg_confidence_score": avg_confidence,
             "field_validity": field_validity,
             "common_issues": common_issues,
             "quality_distribution": quality_distribution,
         }
+
+    @staticmethod
+    def summarize_packed_factors(packed: np.ndarray) -> dict:
+        """Summarize a packed factor array from ContactValidator.calculate_confidence_factors_packed.
+
+        Scores are rebuilt from the quantized factors, so averages can differ from
+        the float scores by a few tenths of a point.
+        """
+        if not len(packed):
+            return {"avg_confidence_score": 0.0, "avg_factors": {}, "quality_distribution": {}}
+
+        scores = np.minimum(100.0, packed.sum(axis=1, dtype=np.uint32) / CONFIDENCE_FACTOR_SCALE / 110.0 * 100.0)
+        avg_factors = packed.mean(axis=0) / CONFIDENCE_FACTOR_SCALE
+        # Buckets of 20 points: 0-1 poor, 2 fair, 3 good, 4-5 excellent
+        buckets = np.bincount(np.clip(scores // 20, 1, 4).astype(np.intp), minlength=5)
+
+        return {
+            "avg_confidence_score": round(float(scores.mean()), 1),
+            "avg_factors": {name: round(float(value), 1) for name, value in zip(CONFIDENCE_FACTOR_FIELDS, avg_factors)},
+            "quality_distribution": {
+                "excellent": int(buckets[4]),
+                "good": int(buckets[3]),
+                "fair": int(buckets[2]),
+                "poor": int(buckets[1]),
+            },
+        }
+
+    @staticmethod
+    def generate_summary_vectorized(contacts_df: pd.DataFrame, scores: Optional[Sequence[float]] = None) -> dict:
+        """Generate a batch summary straight from a contacts DataFrame using column operations.
+
+        Applies the same field rules as ContactValidator (without email
+        verification) to whole columns at once, so large batches skip building a
+        ContactValidation per row. Issue texts are not materialized on this path,
+        so ``common_issues`` is always empty; use generate_summary when they are needed.
+        """
+        total = len(contacts_df)
+        if not total:
+            return ValidationSummary.generate_summary([], [])
+
+        def text_column(column: str) -> pd.Series:
+            # Non-string cells count as missing, matching the isinstance checks in ContactValidator
+            if column not in contacts_df:
+                return pd.Series("", index=contacts_df.index, dtype=object)
+            values = contacts_df[column]
+            return values.where(values.map(lambda v: isinstance(v, str)), "").astype(object).str.strip()
+
+        emails = text_column("email").str.lower()
+        email_domains = emails.str.rpartition("@")[2]
+        email_ok = emails.map(_fast_email_check).astype(bool) & ~email_domains.isin(
+            ContactValidator.DISPOSABLE_EMAIL_DOMAINS
+        )
+
+        digits = text_column("phone").str.replace(r"\D", "", regex=True)
+        us_with_country_code = (digits.str.len() == 11) & digits.str.startswith("1")
+        digits = digits.mask(us_with_country_code, digits.str[1:])
+        digit_count = digits.str.len()
+        phone_ok = (
+            (digit_count >= 10)
+            & (digit_count <= 15)
+            & ~digits.str.fullmatch(r"(\d)\1*")
+            & ~digits.str.startswith(_PLACEHOLDER_PHONE_PREFIXES)
+        )
+
+        names = text_column("name")
+        name_length = names.str.len()
+        name_ok = (
+            (name_length >= 2)
+            & (name_length <= 100)
+            & ~names.str.lower().isin(ContactValidator.PLACEHOLDER_NAMES)
+            & (names.str.split().str.len() >= 2)
+            & ~names.str.contains(_NAME_BAD_CHARS_RE.pattern, regex=True)
+        )
+
+        urls = text_column("linkedin_url")
+        linkedin_ok = urls.str.match(_LINKEDIN_RE.pattern) | urls.str.lower().str.contains("linkedin.com", regex=False)
+
+        titles = text_column("title")
+        title_length = titles.str.len()
+        title_ok = (
+            (title_length >= 2) & (title_length <= 200) & ~titles.str.lower().isin(ContactValidator.PLACEHOLDER_TITLES)
+        )
+
+        valid_count = int((email_ok | phone_ok).sum())
+        field_validity = {
+            field_name: round(int(mask.sum()) / total * 100, 1)
+            for field_name, mask in (
+                ("email", email_ok),
+                ("phone", phone_ok),
+                ("name", name_ok),
+                ("linkedin", linkedin_ok),
+                ("title", title_ok),
+            )
+        }
+
+        avg_confidence = 0.0
+        quality_distribution = {"excellent": 0, "good": 0, "fair": 0, "poor": 0}
+        if scores is not None and len(scores):
+            score_values = pd.Series(scores, dtype=float)
+            avg_confidence = round(float(score_values.mean()), 1)
+            quality_distribution = {
+                "excellent": int((score_values >= 80).sum()),
+                "good": int(((score_values >= 60) & (score_values < 80)).sum()),
+                "fair": int(((score_values >= 40) & (score_values < 60)).sum()),
+                "poor": int((score_values < 40).sum()),
+            }
+
+        return {
+            "total_contacts": total,
+            "valid_contacts": valid_count,
+            "invalid_contacts": total - valid_count,
+            "validation_rate": round((valid_count / total) * 100, 1),
+            "avg_confidence_score": avg_confidence,
+            "field_validity": field_validity,
+            "common_issues": {},
+            "quality_distribution": quality_distribution,
+        }
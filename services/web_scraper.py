@@ -1,51 +1,128 @@
 """Web scraping utilities for extracting website content and metadata."""
 
+import asyncio
+import concurrent.futures
 import logging
+import threading
 from typing import Optional
+from urllib.parse import urlsplit, urlunsplit
 
+import httpx
 import requests
 import trafilatura
+from cachetools import TTLCache
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 logger = logging.getLogger(__name__)
 
+USER_AGENT = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"
 
-def get_website_text_content(url: str, timeout: int = 15) -> Optional[str]:
+# Shared session so repeated checks against the same hosts reuse TCP/TLS connections
+_session = requests.Session()
+_adapter = HTTPAdapter(pool_connections=100, pool_maxsize=100, max_retries=Retry(total=2, backoff_factor=0.3))
+_session.mount("https://", _adapter)
+_session.mount("http://", _adapter)
+_session.headers.update({"User-Agent": USER_AGENT})
+
+# Pipelines re-check the same dealer sites; keep results keyed by normalized URL
+_accessibility_cache: TTLCache = TTLCache(maxsize=10000, ttl=3600)
+_metadata_cache: TTLCache = TTLCache(maxsize=10000, ttl=86400)
+_cache_lock = threading.Lock()
+
+
+def _cache_key(url: str) -> str:
+    """Normalize a URL (lowercase scheme/host, no fragment or trailing slash) for cache lookups."""
+    parts = urlsplit(url)
+    return urlunsplit((parts.scheme.lower(), parts.netloc.lower(), parts.path.rstrip("/"), parts.query, ""))
+
+
+def _fetch(url: str, timeout: float = 15) -> Optional[str]:
+    """Download a page through the shared session, returning its HTML or None."""
+    response = _session.get(url, timeout=timeout, allow_redirects=True)
+    if response.status_code >= 400 or not response.content:
+        return None
+    # requests falls back to ISO-8859-1 for text/* without a charset; detect it from the body instead
+    if "charset" not in response.headers.get("Content-Type", "").lower():
+        response.encoding = response.apparent_encoding
+    return response.text
+
+
+def _extract_text(html: str) -> Optional[str]:
+    return trafilatura.extract(
+        html,
+        include_comments=False,
+        include_tables=True,
+        include_links=False,
+        no_fallback=False,
+    )
+
+
+def get_website_text_content(url_or_html: str, timeout: int = 15, *, already_html: bool = False) -> Optional[str]:
     """Extract main text content from a website URL using trafilatura.
 
     Args:
-        url: Website URL to scrape.
+        url_or_html: Website URL to scrape, or downloaded HTML when already_html is set.
         timeout: Request timeout in seconds.
+        already_html: Treat url_or_html as page HTML and skip the download.
 
     Returns:
         Extracted text content or None if failed.
     """
+    if already_html:
+        return _extract_text(url_or_html) if url_or_html else None
+
+    url = url_or_html
     try:
         # Ensure URL has protocol
         if not url.startswith(("http://", "https://")):
             url = "https://" + url
 
         # Download the webpage content
-        downloaded = trafilatura.fetch_url(url)
+        downloaded = _fetch(url, timeout)
 
         if not downloaded:
             return None
 
-        # Extract text content
-        text_content = trafilatura.extract(
-            downloaded,
-            include_comments=False,
-            include_tables=True,
-            include_links=False,
-            no_fallback=False,
-        )
-
-        return text_content
+        return _extract_text(downloaded)
 
     except Exception as e:
         logger.warning(f"Error extracting content from {url}: {e}")
         return None
 
 
+def scrape_page(url: str, timeout: int = 15) -> dict:
+    """Download a page once and extract both its text and metadata.
+
+    Args:
+        url: Website URL to scrape.
+        timeout: Request timeout in seconds.
+
+    Returns:
+        Dict with "text" (str or None) and "metadata" (dict, empty on failure).
+    """
+    result: dict = {"text": None, "metadata": {}}
+    try:
+        if not url.startswith(("http://", "https://")):
+            url = "https://" + url
+
+        downloaded = _fetch(url, timeout)
+        if not downloaded:
+            return result
+
+        result["text"] = _extract_text(downloaded)
+        metadata = _extract_metadata_dict(downloaded, url)
+        if metadata:
+            with _cache_lock:
+                _metadata_cache[_cache_key(url)] = metadata
+        result["metadata"] = dict(metadata)
+
+    except Exception as e:
+        logger.warning(f"Error scraping {url}: {e}")
+
+    return result
+
+
 def get_website_metadata(url: str) -> dict[str, str]:
     """Extract metadata from website including title, description, etc.
 
@@ -60,32 +137,119 @@ def get_website_metadata(url: str) -> dict[str, str]:
         if not url.startswith(("http://", "https://")):
             url = "https://" + url
 
+        key = _cache_key(url)
+        with _cache_lock:
+            cached = _metadata_cache.get(key)
+        if cached is not None:
+            return dict(cached)
+
         # Download the webpage content
-        downloaded = trafilatura.fetch_url(url)
+        downloaded = _fetch(url)
 
         if not downloaded:
             return {}
 
-        # Extract metadata
-        metadata = trafilatura.extract_metadata(downloaded)
+        result = _extract_metadata_dict(downloaded, url)
+        if result:
+            with _cache_lock:
+                _metadata_cache[key] = result
+        return dict(result)
+
+    except Exception as e:
+        logger.warning(f"Error extracting metadata from {url}: {e}")
+        return {}
 
-        result: dict[str, str] = {}
-        if metadata:
-            result["title"] = metadata.title or ""
-            result["description"] = metadata.description or ""
-            result["author"] = metadata.author or ""
-            result["site_name"] = metadata.sitename or ""
-            result["url"] = metadata.url or url
-            result["language"] = metadata.language or ""
-            result["date"] = metadata.date or ""
 
-        return result
+def _extract_metadata_dict(html: str, url: str) -> dict[str, str]:
+    """Pull title, description, etc. out of downloaded HTML."""
+    metadata = trafilatura.extract_metadata(html)
+
+    result: dict[str, str] = {}
+    if metadata:
+        result["title"] = metadata.title or ""
+        result["description"] = metadata.description or ""
+        result["author"] = metadata.author or ""
+        result["site_name"] = metadata.sitename or ""
+        result["url"] = metadata.url or url
+        result["language"] = metadata.language or ""
+        result["date"] = metadata.date or ""
+
+    return result
+
+
+async def get_website_metadata_async(url: str, client: httpx.AsyncClient, timeout: float = 15.0) -> dict[str, str]:
+    """Async variant of get_website_metadata using a shared httpx client.
+
+    Args:
+        url: Website URL to analyze.
+        client: httpx async client.
+        timeout: Request timeout in seconds.
+
+    Returns:
+        Dictionary containing metadata.
+    """
+    try:
+        if not url.startswith(("http://", "https://")):
+            url = "https://" + url
+
+        key = _cache_key(url)
+        with _cache_lock:
+            cached = _metadata_cache.get(key)
+        if cached is not None:
+            return dict(cached)
+
+        resp = await client.get(url, follow_redirects=True, timeout=timeout)
+        if resp.status_code >= 400 or not resp.text:
+            return {}
+
+        result = _extract_metadata_dict(resp.text, url)
+        if result:
+            with _cache_lock:
+                _metadata_cache[key] = result
+        return dict(result)
 
     except Exception as e:
         logger.warning(f"Error extracting metadata from {url}: {e}")
         return {}
 
 
+async def scrape_many(urls: list[str], concurrency: int = 32) -> dict[str, dict[str, str]]:
+    """Fetch metadata for many URLs concurrently.
+
+    Args:
+        urls: Website URLs to analyze.
+        concurrency: Maximum number of requests in flight.
+
+    Returns:
+        Mapping of each input URL to its metadata dict (empty on failure).
+    """
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async with httpx.AsyncClient(headers={"User-Agent": USER_AGENT}) as client:
+
+        async def fetch(url: str) -> dict[str, str]:
+            async with semaphore:
+                return await get_website_metadata_async(url, client)
+
+        results = await asyncio.gather(*(fetch(url) for url in urls))
+
+    return dict(zip(urls, results))
+
+
+def scrape_many_sync(urls: list[str], max_workers: int = 32) -> dict[str, dict[str, str]]:
+    """Fetch metadata for many URLs from synchronous code using a thread pool.
+
+    Args:
+        urls: Website URLs to analyze.
+        max_workers: Number of worker threads.
+
+    Returns:
+        Mapping of each input URL to its metadata dict (empty on failure).
+    """
+    with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
+        return dict(zip(urls, executor.map(get_website_metadata, urls)))
+
+
 def is_website_accessible(url: str, timeout: int = 10) -> bool:
     """Check if a website is accessible.
 
@@ -101,14 +265,18 @@ def is_website_accessible(url: str, timeout: int = 10) -> bool:
         if not url.startswith(("http://", "https://")):
             url = "https://" + url
 
-        response = requests.head(
-            url,
-            timeout=timeout,
-            allow_redirects=True,
-            headers={"User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"},
-        )
+        key = _cache_key(url)
+        with _cache_lock:
+            cached = _accessibility_cache.get(key)
+        if cached is not None:
+            return cached
+
+        response = _session.head(url, timeout=timeout, allow_redirects=True)
+        accessible = response.status_code < 400
 
-        return response.status_code < 400
+        with _cache_lock:
+            _accessibility_cache[key] = accessible
+        return accessible
 
     except Exception:
         return False
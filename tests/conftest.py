@@ -1,7 +1,13 @@
 """Shared test fixtures for DealershipIntel."""
 
+import json
+
 import pytest
 
+from crawlers.platform_detector import PlatformDetector
+from services.role_classifier import RoleClassifier
+from services.validation import ContactValidator
+
 
 @pytest.fixture
 def sample_contact():
@@ -27,7 +33,22 @@ def sample_company():
     }
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
+def role_classifier():
+    return RoleClassifier()
+
+
+@pytest.fixture(scope="session")
+def platform_detector():
+    return PlatformDetector()
+
+
+@pytest.fixture(scope="session")
+def contact_validator():
+    return ContactValidator(email_verification_service=None)
+
+
+@pytest.fixture(scope="session")
 def sample_html_staff_page():
     return """
     <html>
@@ -55,7 +76,7 @@ def sample_html_staff_page():
     """
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_html_social_links():
     return """
     <html>
@@ -79,7 +100,7 @@ def sample_html_social_links():
     """
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_html_dealeron():
     return """
     <html>
@@ -93,3 +114,98 @@ def sample_html_dealeron():
     </body>
     </html>
     """
+
+
+@pytest.fixture(scope="session")
+def sample_autotrader_jsonld():
+    """AutoDealer JSON-LD embedded in sample_autotrader_html (shared; do not mutate)."""
+    return {
+        "@context": "https://schema.org",
+        "@type": "AutoDealer",
+        "name": "Bob's Auto Sales",
+        "telephone": "(207) 555-1234",
+        "address": {
+            "@type": "PostalAddress",
+            "streetAddress": "123 Main St",
+            "addressLocality": "Portland",
+            "addressRegion": "ME",
+            "postalCode": "04101",
+        },
+        "aggregateRating": {
+            "@type": "AggregateRating",
+            "ratingValue": "4.7",
+            "reviewCount": "142",
+        },
+        "openingHoursSpecification": [
+            {
+                "@type": "OpeningHoursSpecification",
+                "dayOfWeek": "Monday",
+                "opens": "09:00",
+                "closes": "18:00",
+            }
+        ],
+    }
+
+
+@pytest.fixture(scope="session")
+def sample_autotrader_html(sample_autotrader_jsonld):
+    """Realistic Autotrader dealer page HTML with JSON-LD and website link."""
+    return f"""
+    <html>
+    <head>
+        <script type="application/ld+json">{json.dumps(sample_autotrader_jsonld)}</script>
+    </head>
+    <body>
+        <div class="dealer-info">
+            <h1>Bob's Auto Sales</h1>
+            <a href="https://www.bobsautosales.com" data-cmp="dealerWebsite">Dealer Website</a>
+            <p>Showing 1-25 of 347 vehicles</p>
+        </div>
+    </body>
+    </html>
+    """
+
+
+@pytest.fixture(scope="session")
+def sample_autotrader_html_no_jsonld():
+    """Autotrader page without JSON-LD markup."""
+    return """
+    <html>
+    <head><title>Some Dealer</title></head>
+    <body>
+        <div class="dealer-info">
+            <h1>Some Dealer Name</h1>
+        </div>
+    </body>
+    </html>
+    """
+
+
+@pytest.fixture(scope="session")
+def sample_autotrader_html_no_website():
+    """Autotrader page with JSON-LD but no external website link."""
+    jsonld = {
+        "@context": "https://schema.org",
+        "@type": "AutoDealer",
+        "name": "No Website Motors",
+        "telephone": "(555) 999-0000",
+        "address": {
+            "@type": "PostalAddress",
+            "streetAddress": "456 Oak Ave",
+            "addressLocality": "Austin",
+            "addressRegion": "TX",
+            "postalCode": "73301",
+        },
+    }
+    return f"""
+    <html>
+    <head>
+        <script type="application/ld+json">{json.dumps(jsonld)}</script>
+    </head>
+    <body>
+        <div class="dealer-info">
+            <h1>No Website Motors</h1>
+        </div>
+    </body>
+    </html>
+    """
@@ -6,9 +6,12 @@ import pytest
 
 from crawlers.autotrader_scraper import (
     AutotraderDealer,
+    AutotraderDealerBatch,
+    _decode_jsonld,
     _extract_dealer_website,
     _extract_inventory_count,
     _extract_jsonld,
+    _parse_html,
     extract_dealer_data,
     parse_autotrader_url,
 )
@@ -16,94 +19,12 @@ from crawlers.autotrader_scraper import (
 # --- Fixtures ---
 
 
-@pytest.fixture
-def sample_autotrader_html():
-    """Realistic Autotrader dealer page HTML with JSON-LD and website link."""
-    jsonld = {
-        "@context": "https://schema.org",
-        "@type": "AutoDealer",
-        "name": "Bob's Auto Sales",
-        "telephone": "(207) 555-1234",
-        "address": {
-            "@type": "PostalAddress",
-            "streetAddress": "123 Main St",
-            "addressLocality": "Portland",
-            "addressRegion": "ME",
-            "postalCode": "04101",
-        },
-        "aggregateRating": {
-            "@type": "AggregateRating",
-            "ratingValue": "4.7",
-            "reviewCount": "142",
-        },
-        "openingHoursSpecification": [
-            {
-                "@type": "OpeningHoursSpecification",
-                "dayOfWeek": "Monday",
-                "opens": "09:00",
-                "closes": "18:00",
-            }
-        ],
-    }
-    return f"""
-    <html>
-    <head>
-        <script type="application/ld+json">{json.dumps(jsonld)}</script>
-    </head>
-    <body>
-        <div class="dealer-info">
-            <h1>Bob's Auto Sales</h1>
-            <a href="https://www.bobsautosales.com" data-cmp="dealerWebsite">Dealer Website</a>
-            <p>Showing 1-25 of 347 vehicles</p>
-        </div>
-    </body>
-    </html>
-    """
-
-
-@pytest.fixture
-def sample_autotrader_html_no_jsonld():
-    """Autotrader page without JSON-LD markup."""
-    return """
-    <html>
-    <head><title>Some Dealer</title></head>
-    <body>
-        <div class="dealer-info">
-            <h1>Some Dealer Name</h1>
-        </div>
-    </body>
-    </html>
-    """
-
-
-@pytest.fixture
-def sample_autotrader_html_no_website():
-    """Autotrader page with JSON-LD but no external website link."""
-    jsonld = {
-        "@context": "https://schema.org",
-        "@type": "AutoDealer",
-        "name": "No Website Motors",
-        "telephone": "(555) 999-0000",
-        "address": {
-            "@type": "PostalAddress",
-            "streetAddress": "456 Oak Ave",
-            "addressLocality": "Austin",
-            "addressRegion": "TX",
-            "postalCode": "73301",
-        },
-    }
-    return f"""
-    <html>
-    <head>
-        <script type="application/ld+json">{json.dumps(jsonld)}</script>
-    </head>
-    <body>
-        <div class="dealer-info">
-            <h1>No Website Motors</h1>
-        </div>
-    </body>
-    </html>
-    """
+@pytest.fixture(autouse=True)
+def clear_jsonld_cache():
+    """Keep decoded JSON-LD from leaking between tests."""
+    _decode_jsonld.cache_clear()
+    yield
+    _decode_jsonld.cache_clear()
 
 
 # --- TestParseAutotraderUrl ---
@@ -134,6 +55,13 @@ class TestParseAutotraderUrl:
         assert dealer_id == "11111"
         assert city_state == "miami-fl"
 
+    def test_repeated_url_is_cached(self):
+        url = "https://www.autotrader.com/car-dealers/boise-id/22222/cached-motors"
+        first = parse_autotrader_url(url)
+        hits = parse_autotrader_url.cache_info().hits
+        assert parse_autotrader_url(url) is first
+        assert parse_autotrader_url.cache_info().hits == hits + 1
+
 
 # --- TestExtractDealerData ---
 
@@ -202,107 +130,129 @@ class TestExtractDealerData:
         assert dealer is None
 
 
+# --- Parsed page fixtures (parsed once per module) ---
+
+
+@pytest.fixture(scope="module")
+def page_auto_dealer(sample_autotrader_html):
+    return _parse_html(sample_autotrader_html)
+
+
+@pytest.fixture(scope="module")
+def page_jsonld_graph():
+    jsonld = {
+        "@context": "https://schema.org",
+        "@graph": [
+            {"@type": "WebPage", "name": "Dealer Page"},
+            {"@type": "AutoDealer", "name": "Graph Dealer"},
+        ],
+    }
+    return _parse_html(f'<script type="application/ld+json">{json.dumps(jsonld)}</script>')
+
+
+@pytest.fixture(scope="module")
+def page_empty_page():
+    return _parse_html("<html><body></body></html>")
+
+
+@pytest.fixture(scope="module")
+def page_website_text_link():
+    return _parse_html('<a href="https://www.dealer.com">Dealer Website</a>')
+
+
+@pytest.fixture(scope="module")
+def page_website_data_cmp_link():
+    return _parse_html('<a href="https://www.dealer.com" data-cmp="dealerWebsiteLink">Visit</a>')
+
+
+@pytest.fixture(scope="module")
+def page_autotrader_link():
+    return _parse_html('<a href="https://www.autotrader.com/inventory">Dealer Website</a>')
+
+
+@pytest.fixture(scope="module")
+def page_no_links():
+    return _parse_html("<div>No links here</div>")
+
+
+@pytest.fixture(scope="module")
+def page_showing_of():
+    return _parse_html("<p>Showing 1-25 of 347 vehicles</p>")
+
+
+@pytest.fixture(scope="module")
+def page_vehicles_for_sale():
+    return _parse_html("<p>123 vehicles for sale</p>")
+
+
+@pytest.fixture(scope="module")
+def page_showing_of_comma_number():
+    return _parse_html("<p>Showing 1-25 of 1,234</p>")
+
+
+@pytest.fixture(scope="module")
+def page_no_inventory():
+    return _parse_html("<p>Welcome to our dealership</p>")
+
+
 # --- TestExtractJsonld ---
 
 
 class TestExtractJsonld:
-    def test_extracts_auto_dealer(self, sample_autotrader_html):
-        from bs4 import BeautifulSoup
-
-        soup = BeautifulSoup(sample_autotrader_html, "lxml")
-        result = _extract_jsonld(soup)
-        assert result is not None
+    def test_extracts_auto_dealer(self, page_auto_dealer, sample_autotrader_jsonld):
+        result = _extract_jsonld(page_auto_dealer)
+        assert result == sample_autotrader_jsonld
         assert result["@type"] == "AutoDealer"
         assert result["name"] == "Bob's Auto Sales"
 
-    def test_handles_graph(self):
-        from bs4 import BeautifulSoup
-
-        jsonld = {
-            "@context": "https://schema.org",
-            "@graph": [
-                {"@type": "WebPage", "name": "Dealer Page"},
-                {"@type": "AutoDealer", "name": "Graph Dealer"},
-            ],
-        }
-        html = f'<script type="application/ld+json">{json.dumps(jsonld)}</script>'
-        soup = BeautifulSoup(html, "lxml")
-        result = _extract_jsonld(soup)
+    def test_handles_graph(self, page_jsonld_graph):
+        result = _extract_jsonld(page_jsonld_graph)
         assert result is not None
         assert result["name"] == "Graph Dealer"
 
-    def test_returns_none_for_no_jsonld(self):
-        from bs4 import BeautifulSoup
-
-        soup = BeautifulSoup("<html><body></body></html>", "lxml")
-        result = _extract_jsonld(soup)
+    def test_returns_none_for_no_jsonld(self, page_empty_page):
+        result = _extract_jsonld(page_empty_page)
         assert result is None
 
+    def test_repeated_payload_decoded_once(self, page_auto_dealer):
+        first = _extract_jsonld(page_auto_dealer)
+        second = _extract_jsonld(page_auto_dealer)
+        assert second is first
+        assert _decode_jsonld.cache_info().misses == 1
+
 
 # --- TestExtractDealerWebsite ---
 
 
 class TestExtractDealerWebsite:
-    def test_text_based_extraction(self):
-        from bs4 import BeautifulSoup
-
-        html = '<a href="https://www.dealer.com">Dealer Website</a>'
-        soup = BeautifulSoup(html, "lxml")
-        assert _extract_dealer_website(soup) == "https://www.dealer.com"
-
-    def test_data_cmp_extraction(self):
-        from bs4 import BeautifulSoup
-
-        html = '<a href="https://www.dealer.com" data-cmp="dealerWebsiteLink">Visit</a>'
-        soup = BeautifulSoup(html, "lxml")
-        assert _extract_dealer_website(soup) == "https://www.dealer.com"
+    def test_text_based_extraction(self, page_website_text_link):
+        assert _extract_dealer_website(page_website_text_link) == "https://www.dealer.com"
 
-    def test_ignores_autotrader_links(self):
-        from bs4 import BeautifulSoup
+    def test_data_cmp_extraction(self, page_website_data_cmp_link):
+        assert _extract_dealer_website(page_website_data_cmp_link) == "https://www.dealer.com"
 
-        html = '<a href="https://www.autotrader.com/inventory">Dealer Website</a>'
-        soup = BeautifulSoup(html, "lxml")
-        assert _extract_dealer_website(soup) == ""
+    def test_ignores_autotrader_links(self, page_autotrader_link):
+        assert _extract_dealer_website(page_autotrader_link) == ""
 
-    def test_returns_empty_when_none_found(self):
-        from bs4 import BeautifulSoup
-
-        html = "<div>No links here</div>"
-        soup = BeautifulSoup(html, "lxml")
-        assert _extract_dealer_website(soup) == ""
+    def test_returns_empty_when_none_found(self, page_no_links):
+        assert _extract_dealer_website(page_no_links) == ""
 
 
 # --- TestExtractInventoryCount ---
 
 
 class TestExtractInventoryCount:
-    def test_showing_x_of_y(self):
-        from bs4 import BeautifulSoup
-
-        html = "<p>Showing 1-25 of 347 vehicles</p>"
-        soup = BeautifulSoup(html, "lxml")
-        assert _extract_inventory_count(soup) == 347
-
-    def test_x_vehicles_for_sale(self):
-        from bs4 import BeautifulSoup
-
-        html = "<p>123 vehicles for sale</p>"
-        soup = BeautifulSoup(html, "lxml")
-        assert _extract_inventory_count(soup) == 123
+    def test_showing_x_of_y(self, page_showing_of):
+        assert _extract_inventory_count(page_showing_of) == 347
 
-    def test_comma_separated_number(self):
-        from bs4 import BeautifulSoup
+    def test_x_vehicles_for_sale(self, page_vehicles_for_sale):
+        assert _extract_inventory_count(page_vehicles_for_sale) == 123
 
-        html = "<p>Showing 1-25 of 1,234</p>"
-        soup = BeautifulSoup(html, "lxml")
-        assert _extract_inventory_count(soup) == 1234
+    def test_comma_separated_number(self, page_showing_of_comma_number):
+        assert _extract_inventory_count(page_showing_of_comma_number) == 1234
 
-    def test_returns_none_when_not_found(self):
-        from bs4 import BeautifulSoup
-
-        html = "<p>Welcome to our dealership</p>"
-        soup = BeautifulSoup(html, "lxml")
-        assert _extract_inventory_count(soup) is None
+    def test_returns_none_when_not_found(self, page_no_inventory):
+        assert _extract_inventory_count(page_no_inventory) is None
 
 
 # --- TestAutotraderDealer ---
@@ -335,3 +285,39 @@ class TestAutotraderDealer:
     def test_full_address_partial(self):
         dealer = AutotraderDealer(city="Portland", state="ME")
         assert dealer.full_address == "Portland, ME"
+
+
+# --- TestAutotraderDealerBatch ---
+
+
+class TestAutotraderDealerBatch:
+    def test_append_from_html_round_trip(self, sample_autotrader_html, sample_autotrader_html_no_jsonld):
+        pages = [
+            (sample_autotrader_html, "https://www.autotrader.com/car-dealers/portland-me/12345/bobs-auto-sales"),
+            (sample_autotrader_html_no_jsonld, "https://www.autotrader.com/car-dealers/austin-tx/67890/some-dealer"),
+        ]
+        batch = AutotraderDealerBatch()
+        for html, url in pages:
+            assert batch.append_from_html(html, url)
+
+        assert len(batch) == 2
+        assert [batch[i] for i in range(len(batch))] == [extract_dealer_data(html, url) for html, url in pages]
+
+    def test_append_from_html_rejects_bad_url(self):
+        batch = AutotraderDealerBatch()
+        assert not batch.append_from_html("<html></html>", "https://example.com/bad")
+        assert len(batch) == 0
+
+    def test_to_pandas(self):
+        batch = AutotraderDealerBatch()
+        batch.append(AutotraderDealer(autotrader_dealer_id="1", name="A", rating_value=4.5, review_count=10))
+        batch.append(AutotraderDealer(autotrader_dealer_id="2", name="B", inventory_count=30))
+
+        df = batch.to_pandas()
+
+        assert df["autotrader_dealer_id"].tolist() == ["1", "2"]
+        assert df["rating_value"].iloc[0] == 4.5
+        assert df["rating_value"].isna().iloc[1]
+        assert df["review_count"].iloc[0] == 10
+        assert df["review_count"].isna().iloc[1]
+        assert df["inventory_count"].iloc[1] == 30
@@ -1,7 +1,10 @@
 """Tests for contact extraction from HTML."""
 
+from selectolax.lexbor import LexborHTMLParser
+
 from crawlers.contact_extractor import (
     extract_contacts_from_html,
+    extract_contacts_from_many,
     extract_emails,
     extract_phones,
 )
@@ -69,3 +72,49 @@ class TestExtractContactsFromHtml:
         contacts = extract_contacts_from_html(sample_html_staff_page, "testdealer.com")
         for contact in contacts:
             assert contact.get("source") == "crawl"
+
+    def test_repeated_titles_share_one_string(self):
+        card = '<div class="staff-member"><h3>{}</h3><p class="title">Sales Consultant</p></div>'
+        html = "<html><body>" + card.format("Amy Adams") + card.format("Ben Brooks") + "</body></html>"
+        contacts = extract_contacts_from_html(html, "testdealer.com")
+        assert [c["title"] for c in contacts] == ["Sales Consultant", "Sales Consultant"]
+        assert contacts[0]["title"] is contacts[1]["title"]
+
+    def test_class_selectors_are_case_sensitive_without_doctype(self):
+        # No DOCTYPE puts lexbor in quirks mode, where it would match .vcard/.name case-insensitively
+        html = (
+            "<html><body>"
+            '<div class="vcard"><span class="Name">Dana Garcia</span><p>Service Advisor</p>'
+            '<a href="mailto:dgarcia@testdealer.com">Email</a></div>'
+            '<div class="Vcard"><h3>Eli Stone</h3><a href="mailto:estone@testdealer.com">Email</a></div>'
+            "</body></html>"
+        )
+        contacts = extract_contacts_from_html(html, "testdealer.com")
+        assert contacts == [{"source": "crawl", "title": "Service Advisor", "email": "dgarcia@testdealer.com"}]
+
+    def test_flat_fallback_from_parsed_tree(self):
+        rows = "".join(f"<li>Inventory item {i}</li>" for i in range(200))
+        person = "<div><h4>Jane Doe</h4><p>Finance Manager</p><p>jdoe@testdealer.com</p></div>"
+        html = f"<html><body><ul>{rows}</ul>{person}</body></html>"
+        expected = [{"email": "jdoe@testdealer.com", "source": "crawl", "name": "Jane Doe", "title": "Finance Manager"}]
+
+        assert extract_contacts_from_html(html, "testdealer.com") == expected
+        assert extract_contacts_from_html(LexborHTMLParser(html), "testdealer.com") == expected
+
+    def test_flat_fallback_finds_script_only_email_from_parsed_tree(self):
+        html = '<div><p>Jane Doe</p><script>var e="jane@testdealer.com";</script><p>Contact us</p></div>'
+        expected = [{"email": "jane@testdealer.com", "source": "crawl"}]
+
+        assert extract_contacts_from_html(html, "testdealer.com") == expected
+        assert extract_contacts_from_html(LexborHTMLParser(html), "testdealer.com") == expected
+
+    def test_batch_extraction(self, sample_html_staff_page):
+        pages = [
+            (sample_html_staff_page, "testdealer.com"),
+            ("<html><body></body></html>", "test.com"),
+            (sample_html_staff_page, ""),
+        ]
+        sequential = [extract_contacts_from_html(html, domain) for html, domain in pages]
+
+        assert list(extract_contacts_from_many(pages, workers=2)) == sequential
+        assert list(extract_contacts_from_many(pages, workers=1)) == sequential
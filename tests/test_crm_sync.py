@@ -1,7 +1,12 @@
 """Tests for CRM sync service."""
 
+import json
 from unittest.mock import MagicMock, patch
 
+import httpx
+import pytest
+import respx
+
 from services.crm_sync import CRMSyncService
 
 
@@ -52,6 +57,60 @@ class TestCRMSyncService:
         assert result["dealership_id"] == 1
         assert result["clients_synced"] == 1
 
+        # Payloads are pre-encoded JSON bodies
+        _, kwargs = mock_session.post.call_args_list[1]
+        assert json.loads(kwargs["data"])["email"] == "john@test.com"
+
+    @patch("services.crm_sync.requests.Session")
+    def test_sync_dealerships_reuses_session(self, mock_session_class):
+        mock_session = MagicMock()
+        mock_session_class.return_value = mock_session
+
+        mock_response = MagicMock()
+        mock_response.ok = True
+        mock_response.json.return_value = {"id": 1}
+        mock_session.post.return_value = mock_response
+
+        service = CRMSyncService(api_url="http://localhost:3000/api", api_key="key")
+
+        batch = [
+            {"domain": f"dealer{i}.com", "contacts": [{"name": "John", "email": f"john@dealer{i}.com"}]}
+            for i in range(3)
+        ]
+        results = service.sync_dealerships(batch, max_workers=2)
+
+        assert [r["domain"] for r in results] == ["dealer0.com", "dealer1.com", "dealer2.com"]
+        assert mock_session_class.call_count == 1
+        # Dealership upsert, client upsert and activity log per dealership
+        assert mock_session.post.call_count == 9
+
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_sync_dealership_async_success(self):
+        respx.post("http://localhost:3000/api/dealerships/by-domain").mock(
+            return_value=httpx.Response(200, json={"id": 7})
+        )
+        clients = respx.post("http://localhost:3000/api/clients").mock(return_value=httpx.Response(200, json={"id": 1}))
+        activities = respx.post("http://localhost:3000/api/activities").mock(return_value=httpx.Response(200))
+
+        service = CRMSyncService(api_url="http://localhost:3000/api", api_key="key")
+        intel_data = {
+            "domain": "test.com",
+            "company_name": "Test Dealer",
+            "contacts": [
+                {"name": "John", "email": "john@test.com"},
+                {"name": "Jane", "email": "jane@test.com"},
+            ],
+        }
+
+        result = await service.sync_dealership_async(intel_data)
+
+        assert result == {"dealership_id": 7, "clients_synced": 2, "domain": "test.com"}
+        assert clients.call_count == 2
+        assert activities.call_count == 1
+        assert clients.calls.last.request.headers["X-API-Key"] == "key"
+        assert json.loads(clients.calls.last.request.content)["dealershipId"] == 7
+
     def test_test_connection_not_configured(self):
         service = CRMSyncService(api_url="", api_key="")
         result = service.test_connection()
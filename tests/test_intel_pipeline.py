@@ -0,0 +1,32 @@
+"""Tests for the intel pipeline's contact validation."""
+
+from pipeline.intel_pipeline import IntelPipeline
+from services.validation import CONFIDENCE_FACTOR_FIELDS, ContactValidator
+
+
+class TestValidateContacts:
+    def test_default_validator(self):
+        pipeline = IntelPipeline()
+        assert isinstance(pipeline.validator, ContactValidator)
+        assert pipeline.validator.email_service is None
+        assert pipeline.validator.role_classifier is pipeline.role_classifier
+
+    def test_batch_scores_match_single_scores(self, sample_contact):
+        pipeline = IntelPipeline()
+        people = [
+            sample_contact,
+            {"name": "Jane Doe", "title": "Sales Consultant", "email": "jane@gmail.com", "source": "crawl"},
+            {"name": "Test", "email": "", "title": ""},
+        ]
+
+        validated = pipeline._validate_contacts(people, "testdealer.com", "Test Honda")
+
+        assert [c["name"] for c in validated] == ["John Smith", "Jane Doe", "Test"]
+        assert [c["source"] for c in validated] == ["apollo", "crawl", "apollo"]
+        for person, result in zip(people, validated):
+            contact = {"company_domain": "testdealer.com", "company_name": "Test Honda", **person}
+            validation = pipeline.validator.validate_contact(contact)
+            score, factors = pipeline.validator.calculate_confidence_score(contact, validation)
+            assert result["confidence_score"] == score
+            for name in CONFIDENCE_FACTOR_FIELDS:
+                assert result[name] == getattr(factors, name)
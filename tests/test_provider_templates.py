@@ -1,15 +1,15 @@
 """Tests for provider-specific contact extraction templates."""
 
 import pytest
+from selectolax.lexbor import LexborHTMLParser
 
 from config.platforms import PLATFORM_SIGNATURES
 from crawlers.contact_extractor import extract_contacts_from_html
-from crawlers.platform_detector import PlatformDetector
 
 # --- Sample HTML fixtures ---
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def dealercom_staff_html():
     """Sample Dealer.com staff page HTML."""
     return """
@@ -47,7 +47,7 @@ def dealercom_staff_html():
     """
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def dealeron_staff_html():
     """Sample DealerOn staff page HTML."""
     return """
@@ -76,7 +76,7 @@ def dealeron_staff_html():
     """
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def dealerinspire_staff_html():
     """Sample DealerInspire staff page HTML."""
     return """
@@ -106,7 +106,7 @@ def dealerinspire_staff_html():
     """
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def generic_staff_html():
     """Staff page with no provider-specific patterns."""
     return """
@@ -124,7 +124,7 @@ def generic_staff_html():
     """
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def dealercom_inventory_html():
     """Sample Dealer.com inventory page HTML."""
     return """
@@ -138,50 +138,87 @@ def dealercom_inventory_html():
     """
 
 
+@pytest.fixture(scope="session")
+def repeated_staff_html():
+    """Staff page listing five people across 50 blocks, so every email repeats."""
+    names = ["Amy Adams", "Ben Brooks", "Cara Cole", "Dan Drake", "Eve Ellis"]
+    blocks = "".join(
+        f"""
+        <div class="staff-member">
+            <h3>{names[i % 5]}</h3>
+            <a href="mailto:{names[i % 5].split()[0].upper()}@testdealer.com">Email</a>
+        </div>"""
+        for i in range(50)
+    )
+    return f"<html><body>{blocks}</body></html>"
+
+
+@pytest.fixture(scope="session")
+def dealercom_tree(dealercom_staff_html):
+    """dealercom_staff_html parsed once for the whole session."""
+    return LexborHTMLParser(dealercom_staff_html)
+
+
 # --- Provider-specific extraction tests ---
 
 
 class TestDealerComExtraction:
-    def test_extracts_all_contacts(self, dealercom_staff_html):
+    def test_extracts_all_contacts(self, dealercom_tree):
         platform_info = PLATFORM_SIGNATURES["Dealer.com"]
-        contacts = extract_contacts_from_html(dealercom_staff_html, "testdealer.com", platform_info)
+        contacts = extract_contacts_from_html(dealercom_tree, "testdealer.com", platform_info)
         assert len(contacts) == 3
 
-    def test_extracts_names(self, dealercom_staff_html):
+    def test_extracts_names(self, dealercom_tree):
         platform_info = PLATFORM_SIGNATURES["Dealer.com"]
-        contacts = extract_contacts_from_html(dealercom_staff_html, "testdealer.com", platform_info)
+        contacts = extract_contacts_from_html(dealercom_tree, "testdealer.com", platform_info)
         names = {c["name"] for c in contacts}
         assert "Mike Johnson" in names
         assert "Sarah Williams" in names
         assert "Tom Davis" in names
 
-    def test_extracts_titles(self, dealercom_staff_html):
+    def test_extracts_titles(self, dealercom_tree):
         platform_info = PLATFORM_SIGNATURES["Dealer.com"]
-        contacts = extract_contacts_from_html(dealercom_staff_html, "testdealer.com", platform_info)
+        contacts = extract_contacts_from_html(dealercom_tree, "testdealer.com", platform_info)
         titles = {c.get("title") for c in contacts}
         assert "General Manager" in titles
         assert "Sales Manager" in titles
         assert "Finance Director" in titles
 
-    def test_extracts_emails(self, dealercom_staff_html):
+    def test_extracts_emails(self, dealercom_tree):
         platform_info = PLATFORM_SIGNATURES["Dealer.com"]
-        contacts = extract_contacts_from_html(dealercom_staff_html, "testdealer.com", platform_info)
+        contacts = extract_contacts_from_html(dealercom_tree, "testdealer.com", platform_info)
         emails = {c.get("email") for c in contacts}
         assert "mjohnson@testdealer.com" in emails
         assert "swilliams@testdealer.com" in emails
 
-    def test_extracts_phones(self, dealercom_staff_html):
+    def test_extracts_phones(self, dealercom_tree):
         platform_info = PLATFORM_SIGNATURES["Dealer.com"]
-        contacts = extract_contacts_from_html(dealercom_staff_html, "testdealer.com", platform_info)
+        contacts = extract_contacts_from_html(dealercom_tree, "testdealer.com", platform_info)
         contacts_with_phone = [c for c in contacts if c.get("phone")]
         assert len(contacts_with_phone) >= 2
 
-    def test_source_is_crawl(self, dealercom_staff_html):
+    def test_source_is_crawl(self, dealercom_tree):
         platform_info = PLATFORM_SIGNATURES["Dealer.com"]
-        contacts = extract_contacts_from_html(dealercom_staff_html, "testdealer.com", platform_info)
+        contacts = extract_contacts_from_html(dealercom_tree, "testdealer.com", platform_info)
         for contact in contacts:
             assert contact["source"] == "crawl"
 
+    def test_selector_priority_with_descendant_selector(self):
+        html = """
+        <div class="staffMembers"><div class="staffMember">
+            <h3>Jane Roe</h3>
+            <div class="staffTitle"><h3>Mike Johnson</h3><p>General Manager</p></div>
+        </div></div>
+        """
+        platform_info = PLATFORM_SIGNATURES["Dealer.com"]
+        contacts = extract_contacts_from_html(html, "testdealer.com", platform_info)
+        assert [(c["name"], c["title"]) for c in contacts] == [("Mike Johnson", "General Manager")]
+
+    def test_tree_matches_raw_html(self, dealercom_staff_html, dealercom_tree):
+        platform_info = PLATFORM_SIGNATURES["Dealer.com"]
+        from_html = extract_contacts_from_html(dealercom_staff_html, "testdealer.com", platform_info)
+        assert extract_contacts_from_html(dealercom_tree, "testdealer.com", platform_info) == from_html
+
 
 class TestDealerOnExtraction:
     def test_extracts_contacts(self, dealeron_staff_html):
@@ -202,6 +239,19 @@ class TestDealerOnExtraction:
         emails = {c.get("email") for c in contacts}
         assert "abrown@testdealeron.com" in emails
 
+    def test_prefers_valid_mailto_over_email_text(self):
+        html = """
+        <div class="team-member">
+            <h3>Alice Brown</h3>
+            <span class="email">alice.brown@testdealeron.com</span>
+            <a href="mailto:info@elsewhere.com">Email</a>
+            <a href="mailto:abrown@testdealeron.com?subject=Hi">Email</a>
+        </div>
+        """
+        platform_info = PLATFORM_SIGNATURES["DealerOn"]
+        contacts = extract_contacts_from_html(html, "testdealeron.com", platform_info)
+        assert [c.get("email") for c in contacts] == ["abrown@testdealeron.com"]
+
 
 class TestDealerInspireExtraction:
     def test_extracts_contacts(self, dealerinspire_staff_html):
@@ -251,43 +301,41 @@ class TestGenericFallback:
 
 
 class TestPlatformDetection:
-    def setup_method(self):
-        self.detector = PlatformDetector()
-
-    def test_detect_dealercom(self, dealercom_staff_html):
-        result = self.detector.detect_from_html(dealercom_staff_html)
+    def test_detect_dealercom(self, platform_detector, dealercom_staff_html):
+        result = platform_detector.detect_from_html(dealercom_staff_html)
         assert result["platform"] == "Dealer.com"
         assert result["confidence"] > 0.7
 
-    def test_detect_dealeron(self, dealeron_staff_html):
-        result = self.detector.detect_from_html(dealeron_staff_html)
+    def test_detect_dealeron(self, platform_detector, dealeron_staff_html):
+        result = platform_detector.detect_from_html(dealeron_staff_html)
         assert result["platform"] == "DealerOn"
         assert result["confidence"] > 0.7
 
-    def test_detect_dealerinspire(self, dealerinspire_staff_html):
-        result = self.detector.detect_from_html(dealerinspire_staff_html)
+    def test_detect_dealerinspire(self, platform_detector, dealerinspire_staff_html):
+        result = platform_detector.detect_from_html(dealerinspire_staff_html)
         assert result["platform"] == "DealerInspire"
         assert result["confidence"] > 0.7
 
-    def test_detect_unknown(self, generic_staff_html):
-        result = self.detector.detect_from_html(generic_staff_html)
+    def test_detect_unknown(self, platform_detector, generic_staff_html):
+        result = platform_detector.detect_from_html(generic_staff_html)
         assert result["platform"] == "Custom/Unknown"
         assert result["confidence"] == 0.0
 
-    def test_detect_wordpress(self):
+    def test_detect_wordpress(self, platform_detector):
         html = '<html><head><link href="/wp-content/themes/flavor/style.css"></head><body></body></html>'
-        result = self.detector.detect_from_html(html)
+        result = platform_detector.detect_from_html(html)
         assert result["platform"] == "WordPress"
 
-    def test_detect_new_provider_dealer_car_search(self):
+    def test_detect_new_provider_dealer_car_search(self, platform_detector):
         html = '<html><head><script src="https://dealercarsearch.com/assets/js/main.js"></script></head><body></body></html>'
-        result = self.detector.detect_from_html(html)
+        result = platform_detector.detect_from_html(html)
         assert result["platform"] == "Dealer Car Search"
 
 
 # --- PlatformInfo completeness tests ---
 
 
+@pytest.mark.fast
 class TestPlatformInfoCompleteness:
     """Verify all platform entries have the required template fields populated."""
 
@@ -338,3 +386,8 @@ class TestDeduplication:
         contacts = extract_contacts_from_html(html, "test.com")
         emails = [c.get("email") for c in contacts if c.get("email")]
         assert len(emails) == len(set(emails))
+
+    def test_deduplicates_repeated_staff_blocks(self, repeated_staff_html):
+        contacts = extract_contacts_from_html(repeated_staff_html, "testdealer.com")
+        emails = [c["email"].lower() for c in contacts]
+        assert emails == [f"{first}@testdealer.com" for first in ("amy", "ben", "cara", "dan", "eve")]
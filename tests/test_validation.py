@@ -1,65 +1,182 @@
 """Tests for contact validation and confidence scoring."""
 
-from services.validation import ContactValidator
+import numpy as np
+import pytest
 
+from services.validation import (
+    CONFIDENCE_FACTOR_FIELDS,
+    ValidationSummary,
+    pack_confidence_factors,
+    unpack_confidence_factors,
+)
 
-class TestContactValidator:
-    def setup_method(self):
-        self.validator = ContactValidator(email_verification_service=None)
 
-    def test_validate_valid_email(self):
-        result = self.validator.validate_email("jsmith@testdealer.com")
+class TestContactValidator:
+    def test_validate_valid_email(self, contact_validator):
+        result = contact_validator.validate_email("jsmith@testdealer.com")
         assert result.is_valid
 
-    def test_validate_invalid_email(self):
-        result = self.validator.validate_email("not-an-email")
+    def test_validate_invalid_email(self, contact_validator):
+        result = contact_validator.validate_email("not-an-email")
         assert not result.is_valid
 
-    def test_validate_empty_email(self):
-        result = self.validator.validate_email("")
+    def test_validate_empty_email(self, contact_validator):
+        result = contact_validator.validate_email("")
         assert not result.is_valid
 
-    def test_validate_personal_email(self):
-        result = self.validator.validate_email("user@gmail.com")
+    def test_validate_personal_email(self, contact_validator):
+        result = contact_validator.validate_email("user@gmail.com")
         assert "Personal email domain" in result.issues[0]
 
-    def test_validate_valid_phone(self):
-        result = self.validator.validate_phone("(555) 123-4567")
+    def test_validate_valid_phone(self, contact_validator):
+        result = contact_validator.validate_phone("(555) 123-4567")
         assert result.is_valid
         assert result.normalized_value is not None
 
-    def test_validate_invalid_phone(self):
-        result = self.validator.validate_phone("123")
+    def test_validate_invalid_phone(self, contact_validator):
+        result = contact_validator.validate_phone("123")
         assert not result.is_valid
 
-    def test_validate_valid_name(self):
-        result = self.validator.validate_name("John Smith")
+    def test_validate_valid_name(self, contact_validator):
+        result = contact_validator.validate_name("John Smith")
         assert result.is_valid
 
-    def test_validate_empty_name(self):
-        result = self.validator.validate_name("")
+    def test_validate_empty_name(self, contact_validator):
+        result = contact_validator.validate_name("")
         assert not result.is_valid
 
-    def test_validate_suspicious_name(self):
-        result = self.validator.validate_name("test")
+    def test_validate_suspicious_name(self, contact_validator):
+        result = contact_validator.validate_name("test")
         assert not result.is_valid
 
-    def test_validate_linkedin_url(self):
-        result = self.validator.validate_linkedin_url("https://linkedin.com/in/jsmith")
+    def test_validate_linkedin_url(self, contact_validator):
+        result = contact_validator.validate_linkedin_url("https://linkedin.com/in/jsmith")
         assert result.is_valid
 
-    def test_validate_non_linkedin_url(self):
-        result = self.validator.validate_linkedin_url("https://example.com/jsmith")
+    def test_validate_non_linkedin_url(self, contact_validator):
+        result = contact_validator.validate_linkedin_url("https://example.com/jsmith")
         assert not result.is_valid
 
-    def test_confidence_score_complete_contact(self, sample_contact):
-        validation = self.validator.validate_contact(sample_contact)
-        score, factors = self.validator.calculate_confidence_score(sample_contact, validation)
+    def test_confidence_score_complete_contact(self, contact_validator, sample_contact):
+        validation = contact_validator.validate_contact(sample_contact)
+        score, factors = contact_validator.calculate_confidence_score(sample_contact, validation)
         assert score > 50  # Complete contact should score well
         assert factors.data_completeness > 0
 
-    def test_confidence_score_minimal_contact(self):
+    def test_confidence_score_minimal_contact(self, contact_validator):
         contact = {"name": "Test", "email": "", "title": ""}
-        validation = self.validator.validate_contact(contact)
-        score, factors = self.validator.calculate_confidence_score(contact, validation)
+        validation = contact_validator.validate_contact(contact)
+        score, factors = contact_validator.calculate_confidence_score(contact, validation)
         assert score < 30  # Minimal contact should score low
+
+
+class TestValidationSummary:
+    def test_vectorized_summary_matches_per_contact_summary(self, contact_validator, sample_contact):
+        import pandas as pd
+
+        contacts = [
+            sample_contact,
+            {"name": "test", "email": "not-an-email", "phone": "123", "title": "n/a"},
+            {"name": "Jane Doe", "email": "jane@mailinator.com", "phone": "1-555-000-0000", "title": "Sales Manager"},
+            {"name": "Bob O'Neil", "email": "bob@gmail.com", "linkedin_url": "linkedin.com/bob", "phone": 5551234567},
+            {},
+        ]
+        validations = [contact_validator.validate_contact(c) for c in contacts]
+        expected = ValidationSummary.generate_summary(contacts, validations)
+        summary = ValidationSummary.generate_summary_vectorized(pd.DataFrame(contacts))
+
+        for key in ("total_contacts", "valid_contacts", "invalid_contacts", "validation_rate", "field_validity"):
+            assert summary[key] == expected[key]
+
+    def test_batch_confidence_scores_match_single_scores(self, contact_validator, sample_contact):
+        contacts = [
+            sample_contact,
+            {**sample_contact, "company_domain": "testdealer.com", "company_name": "Test Honda"},
+            {"name": "Test", "email": "", "title": ""},
+            {"name": "Jane Doe", "email": "jane@gmail.com", "title": "CEO", "linkedin_url": "linkedin.com/jane"},
+        ]
+        validations = [contact_validator.validate_contact(c) for c in contacts]
+
+        scores = contact_validator.calculate_confidence_scores_batch(contacts, validations)
+
+        expected = [contact_validator.calculate_confidence_score(c, v)[0] for c, v in zip(contacts, validations)]
+        assert scores.tolist() == expected
+
+    def test_batch_confidence_factors_match_single_factors(self, contact_validator, sample_contact):
+        contacts = [sample_contact, {"name": "Jane Doe", "email": "jane@gmail.com", "title": "CEO"}]
+        validations = [contact_validator.validate_contact(c) for c in contacts]
+
+        scores, factors = contact_validator.calculate_confidence_batch(contacts, validations)
+
+        assert factors.shape == (2, len(CONFIDENCE_FACTOR_FIELDS))
+        for contact, validation, score, row in zip(contacts, validations, scores.tolist(), factors.tolist()):
+            expected_score, expected_factors = contact_validator.calculate_confidence_score(contact, validation)
+            assert score == expected_score
+            assert row == [getattr(expected_factors, name) for name in CONFIDENCE_FACTOR_FIELDS]
+
+    def test_packed_factors_round_trip_and_summary(self, contact_validator, sample_contact):
+        contacts = [sample_contact, {"name": "Jane Doe", "email": "jane@gmail.com", "title": "CEO"}]
+        validations = [contact_validator.validate_contact(c) for c in contacts]
+        scored = [contact_validator.calculate_confidence_score(c, v) for c, v in zip(contacts, validations)]
+
+        packed = contact_validator.calculate_confidence_factors_packed(contacts, validations)
+
+        assert packed.dtype == np.uint8
+        assert packed.shape == (2, len(CONFIDENCE_FACTOR_FIELDS))
+        assert (packed == pack_confidence_factors([factors for _, factors in scored])).all()
+        for (_, factors), unpacked in zip(scored, unpack_confidence_factors(packed)):
+            for name in CONFIDENCE_FACTOR_FIELDS:
+                assert getattr(unpacked, name) == pytest.approx(getattr(factors, name), abs=0.05)
+
+        summary = ValidationSummary.summarize_packed_factors(packed)
+        expected = ValidationSummary.generate_summary(contacts, validations, scored)
+        assert summary["quality_distribution"] == expected["quality_distribution"]
+        assert summary["avg_confidence_score"] == pytest.approx(expected["avg_confidence_score"], abs=0.5)
+
+    def test_streaming_summary_counts(self, contact_validator, sample_contact):
+        contacts = [sample_contact, {"name": "test", "email": "bad", "title": "n/a"}, {"name": "Jane Doe"}]
+        validations = [contact_validator.validate_contact(c) for c in contacts]
+        scores = [contact_validator.calculate_confidence_score(c, v) for c, v in zip(contacts, validations)]
+        score_values = [score for score, _ in scores]
+
+        rows = ((c, v, s) for c, v, s in zip(contacts, validations, scores))
+        summary = ValidationSummary.generate_summary_streaming(rows)
+
+        # Only the complete sample contact has a valid email/phone; "test" is a placeholder name
+        assert summary["total_contacts"] == 3
+        assert summary["valid_contacts"] == 1
+        assert summary["invalid_contacts"] == 2
+        assert summary["validation_rate"] == 33.3
+        assert summary["field_validity"] == {
+            "email": 33.3,
+            "phone": 33.3,
+            "name": 66.7,
+            "linkedin": 33.3,
+            "title": 33.3,
+        }
+        assert summary["common_issues"]["Missing phone number"] == 2
+        assert summary["common_issues"]["Missing LinkedIn URL"] == 2
+        assert summary["avg_confidence_score"] == round(sum(score_values) / 3, 1)
+        assert summary["quality_distribution"] == {
+            "excellent": sum(v >= 80 for v in score_values),
+            "good": sum(60 <= v < 80 for v in score_values),
+            "fair": sum(40 <= v < 60 for v in score_values),
+            "poor": sum(v < 40 for v in score_values),
+        }
+
+    def test_summary_totals_ignore_missing_scores(self, contact_validator, sample_contact):
+        contacts = [sample_contact, {"name": "test", "email": "bad", "title": "n/a"}, {"name": "Jane Doe"}]
+        validations = [contact_validator.validate_contact(c) for c in contacts]
+        first_score = contact_validator.calculate_confidence_score(contacts[0], validations[0])
+
+        summary = ValidationSummary.generate_summary(contacts, validations, [first_score])
+
+        assert summary["total_contacts"] == 3
+        assert summary["valid_contacts"] == 1
+        assert summary["invalid_contacts"] == 2
+        assert summary["avg_confidence_score"] == round(first_score[0], 1)
+
+    def test_summary_rejects_mismatched_validations(self, contact_validator, sample_contact):
+        validations = [contact_validator.validate_contact(sample_contact)]
+        with pytest.raises(ValueError):
+            ValidationSummary.generate_summary([sample_contact, sample_contact], validations)
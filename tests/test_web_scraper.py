@@ -0,0 +1,131 @@
+"""Tests for web scraping utilities."""
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+import requests
+
+from services import web_scraper
+from services.web_scraper import get_website_metadata, get_website_text_content, is_website_accessible, scrape_page
+
+PAGE_HTML = """
+<html>
+<head><title>Müller Ford – Café</title><meta name="description" content="Neue und gebrauchte Fahrzeuge"></head>
+<body>
+    <article>
+        <p>Willkommen bei Müller Ford. Unser Café ist täglich geöffnet, während wir Ihr Fahrzeug warten.</p>
+    </article>
+</body>
+</html>
+"""
+
+
+def make_response(body: bytes, content_type: str = "text/html", status_code: int = 200) -> requests.Response:
+    response = requests.Response()
+    response.status_code = status_code
+    response.headers["Content-Type"] = content_type
+    response._content = body
+    # As the transport adapter does for real responses
+    response.encoding = requests.utils.get_encoding_from_headers(response.headers)
+    return response
+
+
+@pytest.fixture(autouse=True)
+def clear_caches():
+    web_scraper._metadata_cache.clear()
+    web_scraper._accessibility_cache.clear()
+    yield
+    web_scraper._metadata_cache.clear()
+    web_scraper._accessibility_cache.clear()
+
+
+@pytest.fixture
+def mock_session():
+    with patch("services.web_scraper._session") as session:
+        yield session
+
+
+class TestScrapePage:
+    def test_extracts_text_and_metadata(self, mock_session):
+        mock_session.get.return_value = make_response(PAGE_HTML.encode(), "text/html; charset=utf-8")
+
+        result = scrape_page("mullerford.de")
+
+        assert "Willkommen bei Müller Ford" in result["text"]
+        assert result["metadata"]["description"] == "Neue und gebrauchte Fahrzeuge"
+        assert result["metadata"]["url"] == "https://mullerford.de"
+        mock_session.get.assert_called_once()
+        assert mock_session.get.call_args.args[0] == "https://mullerford.de"
+
+    def test_detects_encoding_without_charset(self, mock_session):
+        mock_session.get.return_value = make_response(PAGE_HTML.encode(), "text/html")
+
+        result = scrape_page("https://mullerford.de")
+
+        assert "Müller Ford" in result["text"]
+        assert "Café" in result["text"]
+        assert "Müller" in result["metadata"]["title"]
+
+    def test_http_error_returns_empty_result(self, mock_session):
+        mock_session.get.return_value = make_response(b"Not Found", status_code=404)
+
+        assert scrape_page("https://mullerford.de") == {"text": None, "metadata": {}}
+
+    def test_request_failure_returns_empty_result(self, mock_session):
+        mock_session.get.side_effect = requests.ConnectionError("refused")
+
+        assert scrape_page("https://mullerford.de") == {"text": None, "metadata": {}}
+
+
+class TestGetWebsiteTextContent:
+    def test_already_html_skips_download(self, mock_session):
+        text = get_website_text_content(PAGE_HTML, already_html=True)
+
+        assert "Willkommen bei Müller Ford" in text
+        mock_session.get.assert_not_called()
+
+    def test_already_html_empty_returns_none(self, mock_session):
+        assert get_website_text_content("", already_html=True) is None
+        mock_session.get.assert_not_called()
+
+
+class TestCaching:
+    def test_metadata_from_scrape_page_is_reused(self, mock_session):
+        mock_session.get.return_value = make_response(PAGE_HTML.encode(), "text/html; charset=utf-8")
+
+        scraped = scrape_page("https://MullerFord.de/")
+        metadata = get_website_metadata("https://mullerford.de")
+
+        assert metadata == scraped["metadata"]
+        assert mock_session.get.call_count == 1
+
+    def test_metadata_cache_hit_returns_copy(self, mock_session):
+        mock_session.get.return_value = make_response(PAGE_HTML.encode(), "text/html; charset=utf-8")
+
+        first = get_website_metadata("https://mullerford.de")
+        first["title"] = "changed"
+        second = get_website_metadata("https://mullerford.de")
+
+        assert second["title"] != "changed"
+        assert mock_session.get.call_count == 1
+
+    def test_accessibility_cache_hit(self, mock_session):
+        mock_session.head.return_value = MagicMock(status_code=200)
+
+        assert is_website_accessible("mullerford.de")
+        assert is_website_accessible("https://mullerford.de/")
+        assert mock_session.head.call_count == 1
+
+    def test_expired_entries_are_refetched(self, mock_session):
+        mock_session.head.return_value = MagicMock(status_code=200)
+        now = 0.0
+        cache = web_scraper.TTLCache(maxsize=10, ttl=60, timer=lambda: now)
+
+        with patch("services.web_scraper._accessibility_cache", cache):
+            is_website_accessible("https://mullerford.de")
+            now = 30.0
+            is_website_accessible("https://mullerford.de")
+            now = 61.0
+            is_website_accessible("https://mullerford.de")
+
+        assert mock_session.head.call_count == 2